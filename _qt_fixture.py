@@ -0,0 +1,42 @@
+import os
+import sys
+
+# Render offscreen unless a platform is chosen, so Qt tests run on CI boxes
+# without a display; this must be set before the QApplication exists
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+
+def _qt_can_start():
+    """Whether a QApplication can start on the configured platform"""
+    try:
+        from PyQt5.QtCore import QLibraryInfo
+    except ImportError:
+        return False
+    if os.environ['QT_QPA_PLATFORM'] != 'offscreen':
+        # Any other platform was chosen explicitly, so trust it
+        return True
+    platforms = os.path.join(QLibraryInfo.location(QLibraryInfo.PluginsPath), 'platforms')
+    try:
+        return any('qoffscreen' in name for name in os.listdir(platforms))
+    except OSError:
+        return False
+
+
+# Checked before any QApplication exists, so a box that cannot run Qt skips
+# the tests instead of paying for Qt start-up only to fail
+HAS_QT = _qt_can_start()
+
+_qapp = None
+
+
+def get_qapp():
+    """Return the process-wide QApplication, creating it on first use
+
+    One QApplication per process, so Qt plugin loading is paid once no
+    matter how many Qt test modules use it.
+    """
+    global _qapp
+    if _qapp is None:
+        from PyQt5.QtWidgets import QApplication
+        _qapp = QApplication.instance() or QApplication(sys.argv)
+    return _qapp
@@ -1,9 +1,16 @@
-from flask import Flask, jsonify, render_template
+from flask import Flask, Response, jsonify, render_template
+from flask.json import JSONDecoder, JSONEncoder
+import orjson
 import time
 import numpy as np
 from datetime import datetime
 import logging
 import os
+import queue
+import threading
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from app.models import MemoryStats, CacheStats, PerformanceMetrics, MemoryOptimizer, CacheOptimizer
@@ -20,70 +27,159 @@ template_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), 'template
 static_dir = os.path.abspath(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'statics'))
 app = Flask(__name__, template_folder=template_dir, static_folder=static_dir, static_url_path='/static')
 
+class OrjsonEncoder(JSONEncoder):
+    """JSON encoder that serializes with orjson instead of the pure-Python encoder"""
+
+    def encode(self, o):
+        # Datetimes are passed through to Flask's default() so they keep
+        # the same HTTP date format jsonify has always produced
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if self.indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(o, default=self.default, option=option).decode()
+
+class OrjsonDecoder(JSONDecoder):
+    """JSON decoder that parses with orjson instead of the pure-Python decoder"""
+
+    def decode(self, s):
+        return orjson.loads(s)
+
+# jsonify and request/response get_json() build their codecs from these, so
+# every endpoint and test client picks them up
+app.json_encoder = OrjsonEncoder
+app.json_decoder = OrjsonDecoder
+
+# Options for payloads serialized directly with orjson, bypassing jsonify
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+def make_json_response(data_bytes, status=200):
+    """Wrap an already-serialized JSON body in a response"""
+    return Response(data_bytes, status=status, mimetype='application/json')
+
+# Samples the memory stats while the request thread gathers the rest;
+# psutil releases the GIL while it reads /proc, so the two really overlap
+_SAMPLE_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix='stats-sampler')
+
 class MemoryMonitor:
+    # 1 minute at 1 second intervals; deques drop the oldest sample on append
+    MAX_HISTORY = 60
+
     def __init__(self):
-        self.memory_history = []
-        self.cache_history = []
-        self.timestamps = []
+        self.memory_history = deque(maxlen=self.MAX_HISTORY)
+        self.cache_history = deque(maxlen=self.MAX_HISTORY)
+        self.timestamps = deque(maxlen=self.MAX_HISTORY)
         self.optimization_history = {
             'memory': {'before': None, 'after': None, 'details': []},
             'cache': {'before': None, 'after': None, 'details': []}
         }
         self.performance_metrics = {
-            'response_times': [],
-            'throughput': [],
-            'page_faults': [],
-            'swap_usage': []
+            'response_times': deque(maxlen=self.MAX_HISTORY),
+            'throughput': deque(maxlen=self.MAX_HISTORY),
+            'page_faults': deque(maxlen=self.MAX_HISTORY),
+            'swap_usage': deque(maxlen=self.MAX_HISTORY)
         }
+        # Columns charted by /api/visualization, kept as typed arrays so they
+        # reach Plotly and orjson without a per-sample Python loop. Each sample
+        # is written twice, MAX_HISTORY apart, so the ordered window is always
+        # one contiguous slice.
+        # Memory percent is stored as tenths of a percent, the precision psutil reports
+        self._memory_percent = np.zeros(2 * self.MAX_HISTORY, dtype=np.uint16)
+        self._cache_hits = np.zeros(2 * self.MAX_HISTORY, dtype=np.float64)
+        self._cursor = 0
+        self._count = 0
+        # (monotonic time, dict) of the last psutil reads, reused within STATS_TTL
+        self._memory_cache = (float('-inf'), None)
+        self._cache_cache = (float('-inf'), None)
 
-    def get_memory_stats(self):
-        memory_stats = MemoryStats.get_current()
-        return memory_stats.to_dict()
+    # Seconds a psutil reading is reused, so back-to-back callers share one read
+    STATS_TTL = 0.05
 
-    def get_cache_stats(self):
-        cache_stats = CacheStats.get_current()
-        return cache_stats.to_dict()
+    def get_memory_stats(self, fresh=False):
+        """Current memory stats; fresh=True skips the TTL cache, e.g. around an optimization"""
+        ts, cached = self._memory_cache
+        now = time.monotonic()
+        if not fresh and now - ts < self.STATS_TTL:
+            return cached
+        memory_stats = MemoryStats.get_current().to_dict()
+        self._memory_cache = (now, memory_stats)
+        return memory_stats
+
+    def get_cache_stats(self, fresh=False):
+        """Current cache stats; fresh=True skips the TTL cache, e.g. around an optimization"""
+        ts, cached = self._cache_cache
+        now = time.monotonic()
+        if not fresh and now - ts < self.STATS_TTL:
+            return cached
+        cache_stats = CacheStats.get_current(fresh).to_dict()
+        self._cache_cache = (now, cache_stats)
+        return cache_stats
 
     def get_performance_metrics(self):
         metrics = PerformanceMetrics.get_current()
         return metrics.to_dict()
 
+    def clear_history(self):
+        """Drop all recorded samples, keeping the optimization history"""
+        self.memory_history.clear()
+        self.cache_history.clear()
+        self.timestamps.clear()
+        for samples in self.performance_metrics.values():
+            samples.clear()
+        self._cursor = 0
+        self._count = 0
+
+    def _column_view(self, column):
+        """Return a history column oldest-first as a view into its buffer"""
+        if self._count < self.MAX_HISTORY:
+            return column[:self._count]
+        return column[self._cursor:self._cursor + self.MAX_HISTORY]
+
+    def memory_percent_history(self):
+        """Memory usage percentages, oldest first"""
+        return self._column_view(self._memory_percent) / 10
+
+    def cache_hits_history(self):
+        """Cache hit counts, oldest first"""
+        return self._column_view(self._cache_hits)
+
     def record_stats(self):
         try:
-            memory_stats = self.get_memory_stats()
+            memory_future = _SAMPLE_POOL.submit(self.get_memory_stats)
             cache_stats = self.get_cache_stats()
             metrics = self.get_performance_metrics()
+            memory_stats = memory_future.result()
             
             self.memory_history.append(memory_stats)
             self.cache_history.append(cache_stats)
             
+            i = self._cursor
+            for column, value in ((self._memory_percent, round(memory_stats['percent'] * 10)),
+                                  (self._cache_hits, cache_stats['hits'])):
+                column[i] = column[i + self.MAX_HISTORY] = value
+            self._cursor = (i + 1) % self.MAX_HISTORY
+            self._count = min(self._count + 1, self.MAX_HISTORY)
+            
             self.performance_metrics['response_times'].append(metrics['response_time'])
             self.performance_metrics['throughput'].append(metrics['throughput'])
             self.performance_metrics['page_faults'].append(metrics['page_faults'])
             self.performance_metrics['swap_usage'].append(metrics['swap_rate'])
             
             self.timestamps.append(datetime.now())
-            
-            # Limit history length
-            max_history = 60  # 1 minute at 1 second intervals
-            if len(self.memory_history) > max_history:
-                self.memory_history = self.memory_history[-max_history:]
-                self.cache_history = self.cache_history[-max_history:]
-                self.timestamps = self.timestamps[-max_history:]
-                self.performance_metrics['response_times'] = self.performance_metrics['response_times'][-max_history:]
-                self.performance_metrics['throughput'] = self.performance_metrics['throughput'][-max_history:]
-                self.performance_metrics['page_faults'] = self.performance_metrics['page_faults'][-max_history:]
-                self.performance_metrics['swap_usage'] = self.performance_metrics['swap_usage'][-max_history:]
         except Exception as e:
             logger.error(f"Error recording stats: {str(e)}")
 
 # Initialize the monitor
 monitor = MemoryMonitor()
 
+# Error bodies never change, so they are serialized once
+_NOT_FOUND_BODY = orjson.dumps({'error': 'Not found'})
+
 # Error handlers
 @app.errorhandler(404)
 def not_found_error(error):
-    return jsonify({'error': 'Not found'}), 404
+    return make_json_response(_NOT_FOUND_BODY, 404)
 
 @app.errorhandler(500)
 def internal_error(error):
@@ -101,19 +197,19 @@ def index():
 def get_real_time_stats():
     try:
         monitor.record_stats()
-        return jsonify({
+        return make_json_response(orjson.dumps({
             'memory': monitor.memory_history[-1],
             'cache': monitor.cache_history[-1],
             'timestamp': monitor.timestamps[-1].strftime('%H:%M:%S')
-        })
+        }, option=_ORJSON_OPTIONS))
     except Exception as e:
         logger.error(f"Error getting real-time stats: {str(e)}")
         return jsonify({'error': 'Internal server error'}), 500
 
-@app.route('/api/optimize-memory')
-def optimize_memory():
+def _optimize_memory_result():
+    """Run memory optimization and return the response payload and status code"""
     try:
-        before_stats = monitor.get_memory_stats()
+        before_stats = monitor.get_memory_stats(fresh=True)
         monitor.optimization_history['memory']['before'] = before_stats
         
         # Perform real memory optimization with details
@@ -122,46 +218,46 @@ def optimize_memory():
         
         if not success:
             logger.warning(f"Memory optimization failed: {message}")
-            return jsonify({
+            return {
                 'success': False,
                 'message': message,
                 'before': before_stats,
                 'after': before_stats,
-                'details': details,
+                'details': details.to_json(),
                 'improvement': {
                     'before_ratio': before_stats['percent'],
                     'after_ratio': before_stats['percent'],
                     'improvement': 0
                 }
-            })
+            }, 200
         
         # Get memory stats after optimization
-        after_stats = monitor.get_memory_stats()
+        after_stats = monitor.get_memory_stats(fresh=True)
         monitor.optimization_history['memory']['after'] = after_stats
         
-        return jsonify({
+        return {
             'success': True,
             'message': message,
             'before': before_stats,
             'after': after_stats,
-            'details': details,
+            'details': details.to_json(),
             'improvement': compare_performance(
                 before_stats['percent'],
                 after_stats['percent']
             )
-        })
+        }, 200
     except Exception as e:
         logger.error(f"Error optimizing memory: {str(e)}")
-        return jsonify({
+        return {
             'success': False,
             'message': f"Error during memory optimization: {str(e)}",
             'error': str(e)
-        }), 500
+        }, 500
 
-@app.route('/api/optimize-cache')
-def optimize_cache():
+def _optimize_cache_result():
+    """Run cache optimization and return the response payload and status code"""
     try:
-        before_stats = monitor.get_cache_stats()
+        before_stats = monitor.get_cache_stats(fresh=True)
         monitor.optimization_history['cache']['before'] = before_stats
         
         # Perform real cache optimization with details
@@ -170,215 +266,330 @@ def optimize_cache():
         
         if not success:
             logger.warning(f"Cache optimization failed: {message}")
-            return jsonify({
+            return {
                 'success': False,
                 'message': message,
                 'before': before_stats,
                 'after': before_stats,
-                'details': details,
+                'details': details.to_json(),
                 'improvement': {
                     'before_ratio': before_stats['hit_ratio'],
                     'after_ratio': before_stats['hit_ratio'],
                     'improvement': 0
                 }
-            })
+            }, 200
         
         # Get cache stats after optimization
-        after_stats = monitor.get_cache_stats()
+        after_stats = monitor.get_cache_stats(fresh=True)
         
         # No artificial improvements - show real stats
         logger.info("Using real cache statistics without artificial improvements")
         
         monitor.optimization_history['cache']['after'] = after_stats
         
-        return jsonify({
+        return {
             'success': True,
             'message': message,
             'before': before_stats,
             'after': after_stats,
-            'details': details,
+            'details': details.to_json(),
             'improvement': compare_performance(
                 before_stats['hit_ratio'],
                 after_stats['hit_ratio']
             )
-        })
+        }, 200
     except Exception as e:
         logger.error(f"Error optimizing cache: {str(e)}")
-        return jsonify({
+        return {
             'success': False,
             'message': f"Error during cache optimization: {str(e)}",
             'error': str(e)
-        }), 500
+        }, 500
 
-@app.route('/api/visualization')
-def get_visualization():
-    try:
-        # Create visualization using plotly with more charts
-        fig = make_subplots(
-            rows=4, cols=2,
-            subplot_titles=(
-                'Memory Usage Over Time',
-                'Cache Performance Over Time',
-                'Memory Usage Comparison',
-                'Cache Hit/Miss Ratio',
-                'Memory Optimization Impact',
-                'Cache Performance Metrics',
-                'System Performance Metrics',
-                'Memory Allocation Distribution'
-            ),
-            vertical_spacing=0.08,
-            horizontal_spacing=0.1,
-            specs=[
-                [{"type": "scatter"}, {"type": "scatter"}],
-                [{"type": "bar"}, {"type": "pie"}],
-                [{"type": "bar"}, {"type": "bar"}],
-                [{"type": "scatter"}, {"type": "sunburst"}]
-            ]
+# Background optimization jobs. Requests only enqueue work and return a task
+# id, so filesystem and PowerShell work never holds a request thread open.
+_OPTIMIZATION_JOBS = {
+    'memory': _optimize_memory_result,
+    'cache': _optimize_cache_result
+}
+# Jobs write monitor.optimization_history and the optimizers'
+# last_optimization_details, so only one may run at a time
+_optimization_run_lock = threading.Lock()
+
+def _run_optimization(kind):
+    """Run one optimization job and return its payload and status code"""
+    with _optimization_run_lock:
+        return _OPTIMIZATION_JOBS[kind]()
+
+@app.route('/api/optimize-memory')
+def optimize_memory():
+    payload, status = _run_optimization('memory')
+    return jsonify(payload), status
+
+@app.route('/api/optimize-cache')
+def optimize_cache():
+    payload, status = _run_optimization('cache')
+    return jsonify(payload), status
+
+_MAX_OPTIMIZATION_TASKS = 100
+# Each job is a full optimization, so refuse new ones rather than pile them up
+_MAX_QUEUED_OPTIMIZATIONS = 10
+_optimization_queue = queue.Queue(maxsize=_MAX_QUEUED_OPTIMIZATIONS)
+_optimization_tasks = {}
+_optimization_tasks_lock = threading.Lock()
+_optimization_worker_thread = None
+
+def _optimization_worker():
+    """Run queued optimization jobs one at a time and record their results"""
+    while True:
+        task_id, kind = _optimization_queue.get()
+        with _optimization_tasks_lock:
+            # Tasks evicted while queued have nobody left to report to
+            evicted = task_id not in _optimization_tasks
+            if not evicted:
+                _optimization_tasks[task_id]['status'] = 'running'
+        if evicted:
+            _optimization_queue.task_done()
+            continue
+        try:
+            result, _ = _run_optimization(kind)
+        except Exception as e:
+            logger.error(f"Error running {kind} optimization task: {str(e)}")
+            result = {'success': False, 'message': str(e), 'error': str(e)}
+        with _optimization_tasks_lock:
+            if task_id in _optimization_tasks:
+                _optimization_tasks[task_id].update(status='done', result=result)
+        _optimization_queue.task_done()
+
+def _start_optimization_worker():
+    """Start the worker thread on first use; call with the tasks lock held"""
+    global _optimization_worker_thread
+    if _optimization_worker_thread is None:
+        _optimization_worker_thread = threading.Thread(
+            target=_optimization_worker, name='optimization-worker', daemon=True
         )
-        
+        _optimization_worker_thread.start()
+
+@app.route('/api/optimize/<kind>', methods=['POST'])
+def queue_optimization(kind):
+    if kind not in _OPTIMIZATION_JOBS:
+        return make_json_response(_NOT_FOUND_BODY, 404)
+    task_id = uuid.uuid4().hex
+    with _optimization_tasks_lock:
+        # Holding the lock keeps the worker from seeing the task before it
+        # is registered, and nothing is evicted when the queue is full
+        try:
+            _optimization_queue.put_nowait((task_id, kind))
+        except queue.Full:
+            return jsonify({'error': 'Too many optimizations queued'}), 503
+        # Keep only the most recent tasks; dicts preserve insertion order
+        while len(_optimization_tasks) >= _MAX_OPTIMIZATION_TASKS:
+            del _optimization_tasks[next(iter(_optimization_tasks))]
+        _optimization_tasks[task_id] = {'task_id': task_id, 'kind': kind, 'status': 'queued', 'result': None}
+        _start_optimization_worker()
+    return jsonify({'task_id': task_id, 'status': 'queued'}), 202
+
+@app.route('/api/optimize/status/<task_id>')
+def optimization_status(task_id):
+    with _optimization_tasks_lock:
+        task = _optimization_tasks.get(task_id)
+        task = dict(task) if task is not None else None
+    if task is None:
+        return make_json_response(_NOT_FOUND_BODY, 404)
+    return jsonify(task)
+
+def _build_visualization_skeleton():
+    """Build the static parts of the dashboard figure once
+
+    Returns the serialized layout and a dict of trace templates keyed by
+    chart, each already carrying its subplot axis or domain references;
+    requests only fill in the data arrays.
+    """
+    # Create visualization using plotly with more charts
+    fig = make_subplots(
+        rows=4, cols=2,
+        subplot_titles=(
+            'Memory Usage Over Time',
+            'Cache Performance Over Time',
+            'Memory Usage Comparison',
+            'Cache Hit/Miss Ratio',
+            'Memory Optimization Impact',
+            'Cache Performance Metrics',
+            'System Performance Metrics',
+            'Memory Allocation Distribution'
+        ),
+        vertical_spacing=0.08,
+        horizontal_spacing=0.1,
+        specs=[
+            [{"type": "scatter"}, {"type": "scatter"}],
+            [{"type": "bar"}, {"type": "pie"}],
+            [{"type": "bar"}, {"type": "bar"}],
+            [{"type": "scatter"}, {"type": "sunburst"}]
+        ]
+    )
+
+    # One placeholder per chart, added exactly as the live traces would be
+    # so plotly resolves each trace's subplot references
+    placeholders = (
         # 1. Memory usage over time
-        memory_usage = [m['percent'] for m in monitor.memory_history]
-        timestamps = [t.strftime('%H:%M:%S') for t in monitor.timestamps]
-        
-        fig.add_trace(
-            go.Scatter(
-                x=timestamps,
-                y=memory_usage,
-                name='Memory Usage',
-                line=dict(color='#4a90e2', width=2)
-            ),
-            row=1, col=1
-        )
-        
+        ('memory_usage', go.Scatter(
+            x=[], y=[],
+            name='Memory Usage',
+            line=dict(color='#4a90e2', width=2)
+        ), 1, 1),
         # 2. Cache performance over time
-        cache_hits = [c['hits'] for c in monitor.cache_history]
-        fig.add_trace(
-            go.Scatter(
-                x=timestamps,
-                y=cache_hits,
-                name='Cache Hits',
-                line=dict(color='#2ecc71', width=2)
+        ('cache_hits', go.Scatter(
+            x=[], y=[],
+            name='Cache Hits',
+            line=dict(color='#2ecc71', width=2)
+        ), 1, 2),
+        # 3. Memory usage comparison
+        ('memory_comparison', go.Bar(
+            x=['Before', 'After'], y=[],
+            name='Memory Usage',
+            marker_color=['#ff7675', '#55efc4']
+        ), 2, 1),
+        # 4. Cache hit/miss ratio
+        ('cache_ratio', go.Pie(
+            labels=['Hits', 'Misses'], values=[],
+            name='Cache Hit/Miss',
+            marker=dict(colors=['#00b894', '#ff7675'])
+        ), 2, 2),
+        # 5. Memory optimization impact
+        ('memory_before', go.Bar(
+            name='Before',
+            x=['Used', 'Free'], y=[],
+            marker_color='#ff7675'
+        ), 3, 1),
+        ('memory_after', go.Bar(
+            name='After',
+            x=['Used', 'Free'], y=[],
+            marker_color='#55efc4'
+        ), 3, 1),
+        # 6. Cache performance metrics
+        ('cache_before', go.Bar(
+            name='Before',
+            x=['Hit Ratio', 'Access Time'], y=[],
+            marker_color='#ff7675'
+        ), 3, 2),
+        ('cache_after', go.Bar(
+            name='After',
+            x=['Hit Ratio', 'Access Time'], y=[],
+            marker_color='#55efc4'
+        ), 3, 2),
+        # 7. System Performance Metrics
+        ('response_time', go.Scatter(
+            x=[], y=[],
+            name='Response Time',
+            line=dict(color='#6c5ce7', width=2)
+        ), 4, 1),
+        ('throughput', go.Scatter(
+            x=[], y=[],
+            name='Throughput',
+            line=dict(color='#00b894', width=2),
+            yaxis='y2'
+        ), 4, 1),
+        # 8. Memory Allocation Sunburst
+        ('memory_distribution', go.Sunburst(
+            labels=['Total', 'Used', 'Cached', 'Free', 'Active', 'Inactive'],
+            parents=['', 'Total', 'Total', 'Total', 'Used', 'Used'],
+            values=[],
+            branchvalues='total',
+            marker=dict(
+                colors=['#2ecc71', '#e74c3c', '#3498db', '#95a5a6', '#e67e22', '#9b59b6']
             ),
-            row=1, col=2
+            name='Memory Distribution'
+        ), 4, 2),
+    )
+    for _, trace, row, col in placeholders:
+        fig.add_trace(trace, row=row, col=col)
+
+    # Update layout for better visualization
+    fig.update_layout(
+        height=1400,  # Increased height for more charts
+        showlegend=True,
+        template='plotly_dark',  # Change to dark theme for better contrast
+        paper_bgcolor='rgba(45, 52, 54, 1)',  # Dark background
+        plot_bgcolor='rgba(45, 52, 54, 1)',  # Dark background 
+        font=dict(
+            family='Segoe UI, sans-serif',
+            size=12,
+            color='#dfe6e9'  # Light colored text for dark background
+        ),
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1,
+            font=dict(color='#dfe6e9')  # Light colored legend text
         )
+    )
+
+    # Add second y-axis for throughput with better colors
+    fig.update_layout(
+        yaxis7=dict(title="Response Time (ms)", titlefont=dict(color='#6c5ce7'), tickfont=dict(color='#dfe6e9')),
+        yaxis8=dict(title="Throughput (req/s)", titlefont=dict(color='#00b894'), tickfont=dict(color='#dfe6e9'), overlaying="y7", side="right")
+    )
+
+    # Update axes labels for all charts with better colors
+    fig.update_xaxes(title_text="Time", titlefont=dict(color='#dfe6e9'), tickfont=dict(color='#dfe6e9'), row=1, col=1)
+    fig.update_xaxes(title_text="Time", titlefont=dict(color='#dfe6e9'), tickfont=dict(color='#dfe6e9'), row=1, col=2)
+    fig.update_yaxes(title_text="Memory Usage (%)", titlefont=dict(color='#4a90e2'), tickfont=dict(color='#dfe6e9'), row=1, col=1)
+    fig.update_yaxes(title_text="Cache Hits", titlefont=dict(color='#2ecc71'), tickfont=dict(color='#dfe6e9'), row=1, col=2)
+    fig.update_yaxes(title_text="Memory Usage (%)", titlefont=dict(color='#4a90e2'), tickfont=dict(color='#dfe6e9'), row=2, col=1)
+    fig.update_yaxes(title_text="GB", titlefont=dict(color='#dfe6e9'), tickfont=dict(color='#dfe6e9'), row=3, col=1)
+    fig.update_yaxes(title_text="Value", titlefont=dict(color='#dfe6e9'), tickfont=dict(color='#dfe6e9'), row=3, col=2)
+
+    skeleton = fig.to_dict()
+    traces = {key: trace for (key, *_), trace in zip(placeholders, skeleton['data'])}
+    return skeleton['layout'], traces
+
+# The dashboard layout never changes, so plotly only builds and validates it once
+_VIS_LAYOUT, _VIS_TRACES = _build_visualization_skeleton()
+
+def _vis_trace(key, **values):
+    """Copy a trace template with this request's data filled in"""
+    return {**_VIS_TRACES[key], **values}
+
+@app.route('/api/visualization')
+def get_visualization():
+    try:
+        timestamps = [t.strftime('%H:%M:%S') for t in monitor.timestamps]
+        memory_opt = monitor.optimization_history['memory']
+        cache_opt = monitor.optimization_history['cache']
+        
+        # 1-2. Memory usage and cache performance over time
+        data = [
+            _vis_trace('memory_usage', x=timestamps, y=monitor.memory_percent_history()),
+            _vis_trace('cache_hits', x=timestamps, y=monitor.cache_hits_history()),
+        ]
         
         # 3. Memory usage comparison (if optimization was performed)
-        if monitor.optimization_history['memory']['before'] and monitor.optimization_history['memory']['after']:
-            memory_comparison = {
-                'Before': monitor.optimization_history['memory']['before']['percent'],
-                'After': monitor.optimization_history['memory']['after']['percent']
-            }
-            fig.add_trace(
-                go.Bar(
-                    x=list(memory_comparison.keys()),
-                    y=list(memory_comparison.values()),
-                    name='Memory Usage',
-                    marker_color=['#ff7675', '#55efc4']
-                ),
-                row=2, col=1
-            )
+        if memory_opt['before'] and memory_opt['after']:
+            data.append(_vis_trace('memory_comparison', y=[
+                memory_opt['before']['percent'],
+                memory_opt['after']['percent']
+            ]))
         
         # 4. Cache hit/miss ratio (current)
         latest_cache = monitor.cache_history[-1] if monitor.cache_history else monitor.get_cache_stats()
-        fig.add_trace(
-            go.Pie(
-                labels=['Hits', 'Misses'],
-                values=[latest_cache['hits'], latest_cache['misses']],
-                name='Cache Hit/Miss',
-                marker=dict(colors=['#00b894', '#ff7675'])
-            ),
-            row=2, col=2
-        )
+        data.append(_vis_trace('cache_ratio', values=[latest_cache['hits'], latest_cache['misses']]))
         
         # 5. Memory optimization impact (if performed)
-        if monitor.optimization_history['memory']['before'] and monitor.optimization_history['memory']['after']:
-            memory_metrics = {
-                'Used': [
-                    monitor.optimization_history['memory']['before']['used'] / (1024**3),
-                    monitor.optimization_history['memory']['after']['used'] / (1024**3)
-                ],
-                'Free': [
-                    monitor.optimization_history['memory']['before']['free'] / (1024**3),
-                    monitor.optimization_history['memory']['after']['free'] / (1024**3)
-                ]
-            }
-            
-            fig.add_trace(
-                go.Bar(
-                    name='Before',
-                    x=list(memory_metrics.keys()),
-                    y=[memory_metrics[k][0] for k in memory_metrics.keys()],
-                    marker_color='#ff7675'
-                ),
-                row=3, col=1
-            )
-            
-            fig.add_trace(
-                go.Bar(
-                    name='After',
-                    x=list(memory_metrics.keys()),
-                    y=[memory_metrics[k][1] for k in memory_metrics.keys()],
-                    marker_color='#55efc4'
-                ),
-                row=3, col=1
-            )
+        if memory_opt['before'] and memory_opt['after']:
+            for key, stats in (('memory_before', memory_opt['before']), ('memory_after', memory_opt['after'])):
+                data.append(_vis_trace(key, y=[stats['used'] / (1024**3), stats['free'] / (1024**3)]))
         
         # 6. Cache performance metrics (if optimization was performed)
-        if monitor.optimization_history['cache']['before'] and monitor.optimization_history['cache']['after']:
-            cache_metrics = {
-                'Hit Ratio': [
-                    monitor.optimization_history['cache']['before']['hit_ratio'] * 100,
-                    monitor.optimization_history['cache']['after']['hit_ratio'] * 100
-                ],
-                'Access Time': [
-                    monitor.optimization_history['cache']['before']['access_time'],
-                    monitor.optimization_history['cache']['after']['access_time']
-                ]
-            }
-            
-            fig.add_trace(
-                go.Bar(
-                    name='Before',
-                    x=list(cache_metrics.keys()),
-                    y=[cache_metrics[k][0] for k in cache_metrics.keys()],
-                    marker_color='#ff7675'
-                ),
-                row=3, col=2
-            )
-            
-            fig.add_trace(
-                go.Bar(
-                    name='After',
-                    x=list(cache_metrics.keys()),
-                    y=[cache_metrics[k][1] for k in cache_metrics.keys()],
-                    marker_color='#55efc4'
-                ),
-                row=3, col=2
-            )
+        if cache_opt['before'] and cache_opt['after']:
+            for key, stats in (('cache_before', cache_opt['before']), ('cache_after', cache_opt['after'])):
+                data.append(_vis_trace(key, y=[stats['hit_ratio'] * 100, stats['access_time']]))
 
         # 7. System Performance Metrics
         metrics = monitor.performance_metrics
-        
-        fig.add_trace(
-            go.Scatter(
-                x=timestamps,
-                y=metrics['response_times'],
-                name='Response Time',
-                line=dict(color='#6c5ce7', width=2)
-            ),
-            row=4, col=1
-        )
-        
-        fig.add_trace(
-            go.Scatter(
-                x=timestamps,
-                y=metrics['throughput'],
-                name='Throughput',
-                line=dict(color='#00b894', width=2),
-                yaxis='y2'
-            ),
-            row=4, col=1
-        )
+        data.append(_vis_trace('response_time', x=timestamps, y=list(metrics['response_times'])))
+        data.append(_vis_trace('throughput', x=timestamps, y=list(metrics['throughput'])))
 
         # 8. Memory Allocation Sunburst
         if monitor.memory_history:
@@ -387,59 +598,11 @@ def get_visualization():
             used_gb = latest_memory['used'] / (1024**3)
             cached_gb = (latest_memory['total'] - latest_memory['available'] - latest_memory['used']) / (1024**3)
             free_gb = latest_memory['free'] / (1024**3)
-            
-            fig.add_trace(
-                go.Sunburst(
-                    labels=['Total', 'Used', 'Cached', 'Free', 'Active', 'Inactive'],
-                    parents=['', 'Total', 'Total', 'Total', 'Used', 'Used'],
-                    values=[total_gb, used_gb, cached_gb, free_gb, used_gb * 0.7, used_gb * 0.3],
-                    branchvalues='total',
-                    marker=dict(
-                        colors=['#2ecc71', '#e74c3c', '#3498db', '#95a5a6', '#e67e22', '#9b59b6']
-                    ),
-                    name='Memory Distribution'
-                ),
-                row=4, col=2
-            )
-
-        # Update layout for better visualization
-        fig.update_layout(
-            height=1400,  # Increased height for more charts
-            showlegend=True,
-            template='plotly_dark',  # Change to dark theme for better contrast
-            paper_bgcolor='rgba(45, 52, 54, 1)',  # Dark background
-            plot_bgcolor='rgba(45, 52, 54, 1)',  # Dark background 
-            font=dict(
-                family='Segoe UI, sans-serif',
-                size=12,
-                color='#dfe6e9'  # Light colored text for dark background
-            ),
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="right",
-                x=1,
-                font=dict(color='#dfe6e9')  # Light colored legend text
-            )
-        )
-
-        # Add second y-axis for throughput with better colors
-        fig.update_layout(
-            yaxis7=dict(title="Response Time (ms)", titlefont=dict(color='#6c5ce7'), tickfont=dict(color='#dfe6e9')),
-            yaxis8=dict(title="Throughput (req/s)", titlefont=dict(color='#00b894'), tickfont=dict(color='#dfe6e9'), overlaying="y7", side="right")
-        )
-
-        # Update axes labels for all charts with better colors
-        fig.update_xaxes(title_text="Time", titlefont=dict(color='#dfe6e9'), tickfont=dict(color='#dfe6e9'), row=1, col=1)
-        fig.update_xaxes(title_text="Time", titlefont=dict(color='#dfe6e9'), tickfont=dict(color='#dfe6e9'), row=1, col=2)
-        fig.update_yaxes(title_text="Memory Usage (%)", titlefont=dict(color='#4a90e2'), tickfont=dict(color='#dfe6e9'), row=1, col=1)
-        fig.update_yaxes(title_text="Cache Hits", titlefont=dict(color='#2ecc71'), tickfont=dict(color='#dfe6e9'), row=1, col=2)
-        fig.update_yaxes(title_text="Memory Usage (%)", titlefont=dict(color='#4a90e2'), tickfont=dict(color='#dfe6e9'), row=2, col=1)
-        fig.update_yaxes(title_text="GB", titlefont=dict(color='#dfe6e9'), tickfont=dict(color='#dfe6e9'), row=3, col=1)
-        fig.update_yaxes(title_text="Value", titlefont=dict(color='#dfe6e9'), tickfont=dict(color='#dfe6e9'), row=3, col=2)
+            data.append(_vis_trace('memory_distribution', values=[
+                total_gb, used_gb, cached_gb, free_gb, used_gb * 0.7, used_gb * 0.3
+            ]))
 
-        return jsonify(fig.to_dict())
+        return make_json_response(orjson.dumps({'data': data, 'layout': _VIS_LAYOUT}, option=_ORJSON_OPTIONS))
     except Exception as e:
         logger.error(f"Error generating visualization: {str(e)}")
         return jsonify({'error': 'Error generating visualization'}), 500
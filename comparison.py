@@ -0,0 +1,2 @@
+# comparison.py - Import path for the Flask app, which lives in camparison.py
+from app.camparison import *  # noqa: F401,F403
@@ -0,0 +1,17 @@
+import pytest
+
+
+@pytest.fixture(scope='session', autouse=True)
+def _app_ctx():
+    """Push one Flask app context for the whole test session"""
+    # Imported here so a broken or missing web app only fails the Flask
+    # tests, not collection of unrelated modules such as the Qt smoke tests
+    try:
+        from app.comparison import app
+    except ImportError:
+        yield
+        return
+    ctx = app.app_context()
+    ctx.push()
+    yield
+    ctx.pop()
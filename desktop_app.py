@@ -100,14 +100,14 @@ class OptimizeWorker(QThread):
                 
             elif self.optimize_type == 'cache':
                 # Get before stats
-                before_stats = CacheStats.get_current().to_dict()
+                before_stats = CacheStats.get_current(fresh=True).to_dict()
                 self.signals.progress.emit({'type': 'cache', 'stats': before_stats})
                 
                 # Run cache optimization
                 success, message, details = CacheOptimizer.optimize_with_details()
                 
                 # Get after stats
-                after_stats = CacheStats.get_current().to_dict()
+                after_stats = CacheStats.get_current(fresh=True).to_dict()
                 self.signals.progress.emit({'type': 'cache', 'stats': after_stats})
                 
                 # Store details in class attribute
@@ -129,22 +129,13 @@ class MemoryMonitorApp(QMainWindow):
         self.setWindowIcon(QIcon("icon.ico"))
         
         # Initialize data storage
-        self.memory_history = []
-        self.cache_history = []
-        self.timestamps = []
-        self.performance_metrics = {
-            'response_times': [],
-            'throughput': [],
-            'page_faults': [],
-            'swap_usage': []
-        }
         self.optimization_history = {
             'memory': {'before': None, 'after': None, 'details': []},
             'cache': {'before': None, 'after': None, 'details': []}
         }
         
-        # Initialize CPU history
-        self.cpu_history = []
+        # Values from the last timer tick, reused to chart optimization progress
+        self._last_sample = None
         
         # Initialize optimization flags
         self.optimization_in_progress = False
@@ -369,7 +360,6 @@ class MemoryMonitorApp(QMainWindow):
             
             # Get CPU usage
             cpu_percent = psutil.cpu_percent()
-            self.cpu_history.append(cpu_percent)
             
             # Convert to dictionaries
             memory_dict = memory_stats.to_dict()
@@ -377,49 +367,19 @@ class MemoryMonitorApp(QMainWindow):
             perf_dict = perf_metrics.to_dict()
             
             # Store in history
-            current_time = datetime.now()
-            self.memory_history.append(memory_dict)
-            self.cache_history.append(cache_dict)
-            self.timestamps.append(current_time)
-            
-            self.performance_metrics['response_times'].append(perf_dict['response_time'])
-            self.performance_metrics['throughput'].append(perf_dict['throughput'])
-            self.performance_metrics['page_faults'].append(perf_dict['page_faults'])
-            self.performance_metrics['swap_usage'].append(perf_dict['swap_rate'])
-            
-            # Ensure all arrays have the same length
-            min_length = min(
-                len(self.memory_history),
-                len(self.cache_history),
-                len(self.timestamps),
-                len(self.cpu_history),
-                len(self.performance_metrics['response_times']),
-                len(self.performance_metrics['throughput']),
-                len(self.performance_metrics['page_faults']),
-                len(self.performance_metrics['swap_usage'])
+            self.performance_graphs.append_sample(
+                memory_dict['percent'],
+                cpu_percent,
+                cache_dict['hit_ratio'],
+                perf_dict['page_faults'],
+                datetime.now()
             )
-            
-            # Trim all arrays to the same length
-            self.memory_history = self.memory_history[-min_length:]
-            self.cache_history = self.cache_history[-min_length:]
-            self.timestamps = self.timestamps[-min_length:]
-            self.cpu_history = self.cpu_history[-min_length:]
-            self.performance_metrics['response_times'] = self.performance_metrics['response_times'][-min_length:]
-            self.performance_metrics['throughput'] = self.performance_metrics['throughput'][-min_length:]
-            self.performance_metrics['page_faults'] = self.performance_metrics['page_faults'][-min_length:]
-            self.performance_metrics['swap_usage'] = self.performance_metrics['swap_usage'][-min_length:]
-            
-            # Limit history length to prevent using too much memory
-            max_history = 60  # 1 minute at 1 second intervals
-            if min_length > max_history:
-                self.memory_history = self.memory_history[-max_history:]
-                self.cache_history = self.cache_history[-max_history:]
-                self.timestamps = self.timestamps[-max_history:]
-                self.cpu_history = self.cpu_history[-max_history:]
-                self.performance_metrics['response_times'] = self.performance_metrics['response_times'][-max_history:]
-                self.performance_metrics['throughput'] = self.performance_metrics['throughput'][-max_history:]
-                self.performance_metrics['page_faults'] = self.performance_metrics['page_faults'][-max_history:]
-                self.performance_metrics['swap_usage'] = self.performance_metrics['swap_usage'][-max_history:]
+            self._last_sample = {
+                'memory': memory_dict,
+                'cache': cache_dict,
+                'cpu': cpu_percent,
+                'page_faults': perf_dict['page_faults']
+            }
             
             # Update all UI components
             self.update_dashboard_ui(memory_dict, cache_dict)
@@ -427,13 +387,7 @@ class MemoryMonitorApp(QMainWindow):
             self.update_cache_tab(cache_dict)
             
             # Update performance graphs
-            self.performance_graphs.update_all_graphs(
-                self.memory_history,
-                self.cpu_history,
-                self.cache_history,
-                self.performance_metrics,
-                self.timestamps
-            )
+            self.performance_graphs.update_all_graphs()
             
         except Exception as e:
             logger.error(f"Error updating stats: {str(e)}")
@@ -441,16 +395,8 @@ class MemoryMonitorApp(QMainWindow):
             
             # Try to recover from error by resetting histories
             try:
-                self.memory_history = []
-                self.cache_history = []
-                self.timestamps = []
-                self.cpu_history = []
-                self.performance_metrics = {
-                    'response_times': [],
-                    'throughput': [],
-                    'page_faults': [],
-                    'swap_usage': []
-                }
+                self._last_sample = None
+                self.performance_graphs.reset_history()
             except Exception as reset_error:
                 logger.error(f"Error resetting histories: {str(reset_error)}")
     
@@ -587,16 +533,33 @@ class MemoryMonitorApp(QMainWindow):
     def on_optimization_progress(self, progress_data):
         """Handle progress updates during optimization"""
         try:
-            # Update graphs based on progress
+            # Chart the worker's snapshot; the other series repeat the last
+            # tick so the GUI thread takes no samples of its own here
+            last = self._last_sample
+            if last is None:
+                return
             if progress_data['type'] == 'memory':
-                self.memory_history.append(progress_data['stats'])
-                self.timestamps.append(datetime.now())
+                memory_dict = progress_data['stats']
+                cache_dict = last['cache']
+                self.update_memory_tab(memory_dict)
             elif progress_data['type'] == 'cache':
-                self.cache_history.append(progress_data['stats'])
-                self.timestamps.append(datetime.now())
+                memory_dict = last['memory']
+                cache_dict = progress_data['stats']
+                self.update_cache_tab(cache_dict)
+            else:
+                return
+            
+            self.performance_graphs.append_sample(
+                memory_dict['percent'],
+                last['cpu'],
+                cache_dict['hit_ratio'],
+                last['page_faults'],
+                datetime.now()
+            )
             
             # Update UI
-            self.update_stats()
+            self.update_dashboard_ui(memory_dict, cache_dict)
+            self.performance_graphs.update_all_graphs()
             
         except Exception as e:
             logger.error(f"Error handling optimization progress: {str(e)}")
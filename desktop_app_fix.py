@@ -67,13 +67,13 @@ class OptimizeWorker(QThread):
                 
             elif self.optimize_type == 'cache':
                 # Get before stats
-                before_stats = CacheStats.get_current().to_dict()
+                before_stats = CacheStats.get_current(fresh=True).to_dict()
                 
                 # Run cache optimization
                 success, message = CacheOptimizer.optimize()
                 
                 # Get after stats
-                after_stats = CacheStats.get_current().to_dict()
+                after_stats = CacheStats.get_current(fresh=True).to_dict()
                 
                 # Ensure cache hit ratio improves after optimization for better visualization
                 if success and after_stats['hit_ratio'] <= before_stats['hit_ratio']:
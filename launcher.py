@@ -7,6 +7,7 @@ import ctypes
 import subprocess
 import logging
 import time
+import functools
 
 # Configure logging
 logging.basicConfig(
@@ -15,6 +16,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=1)
 def check_admin():
     """Check if the application is running with administrator privileges"""
     try:
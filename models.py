@@ -1,21 +1,261 @@
 import psutil
-import numpy as np
 from datetime import datetime
 import logging
 import os
+import random
 import sys
 import time
 import subprocess
 import ctypes
+import functools
+import atexit
+import base64
+import threading
+import queue
+import heapq
+import operator
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+# Win32 constants for the corrupted-file probe
+_GENERIC_READ = 0x80000000
+_FILE_SHARE_ALL = 0x00000001 | 0x00000002 | 0x00000004  # READ | WRITE | DELETE
+_OPEN_EXISTING = 3
+_FILE_FLAG_SEQUENTIAL_SCAN = 0x08000000
+_FILE_END = 2
+_INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+_PROBE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=1)
+def _load_probe_kernel32():
+    """Load kernel32 with the prototypes used by the file probe, or None off Windows"""
+    try:
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    except (AttributeError, OSError):
+        return None
+    kernel32.CreateFileW.argtypes = [ctypes.c_wchar_p, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_void_p,
+                                     ctypes.c_uint32, ctypes.c_uint32, ctypes.c_void_p]
+    kernel32.CreateFileW.restype = ctypes.c_void_p
+    kernel32.ReadFile.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint32,
+                                  ctypes.POINTER(ctypes.c_uint32), ctypes.c_void_p]
+    kernel32.ReadFile.restype = ctypes.c_int
+    kernel32.SetFilePointerEx.argtypes = [ctypes.c_void_p, ctypes.c_longlong, ctypes.c_void_p, ctypes.c_uint32]
+    kernel32.SetFilePointerEx.restype = ctypes.c_int
+    kernel32.CloseHandle.argtypes = [ctypes.c_void_p]
+    kernel32.CloseHandle.restype = ctypes.c_int
+    return kernel32
+
+
+# psutil caches the pid and platform handle, so reuse one Process object;
+# it is rebuilt when the pid changes so forked workers report themselves
+_current_process = None
+
+
+def _get_current_process():
+    """Return a psutil.Process for this process, re-created after a fork"""
+    global _current_process
+    if _current_process is None or _current_process.pid != os.getpid():
+        _current_process = psutil.Process()
+    return _current_process
+
+# Worker threads used when clearing several cache directories at once
+_CLEAR_WORKERS = 4
+
+# Whether the shared PowerShell process is already closed at exit; it can be
+# restarted many times, but the atexit hook only needs registering once
+_ps_close_registered = False
+
+# Worker threads used to overlap file deletions within one directory
+_UNLINK_WORKERS = 8
+
+# Seconds a single PowerShell step may run before the shared interpreter is recycled
+_PS_TIMEOUT = 60
+
+# System critical processes (lowercase) that must never be flagged for cleanup
+_CRITICAL_PROCESSES = frozenset({
+    'system', 'registry', 'smss.exe', 'csrss.exe', 'wininit.exe',
+    'services.exe', 'lsass.exe', 'winlogon.exe'
+})
+
+class DetailsLog:
+    """Ordered (step, result) log kept as two parallel columns
+
+    Iterating yields (step, result) tuples so existing consumers keep
+    working; to_json() builds the pair list only on egress.
+    """
+    
+    __slots__ = ('keys', 'values')
+    
+    def __init__(self):
+        self.keys = []
+        self.values = []
+    
+    def append(self, key, value):
+        """Record a single step and its result"""
+        self.keys.append(key)
+        self.values.append(value)
+    
+    def extend(self, other):
+        """Append every entry of another DetailsLog or iterable of pairs"""
+        if isinstance(other, DetailsLog):
+            self.keys.extend(other.keys)
+            self.values.extend(other.values)
+        else:
+            for key, value in other:
+                self.append(key, value)
+    
+    def __iter__(self):
+        return zip(self.keys, self.values)
+    
+    def __len__(self):
+        return len(self.keys)
+    
+    def to_json(self):
+        """Convert to a list of [step, result] pairs for JSON serialization"""
+        return [[key, value] for key, value in zip(self.keys, self.values)]
+
+
 class SystemOptimizer:
     """Base class for system optimization functions"""
     
+    # PowerShell helper that flushes the system file cache. The content is
+    # constant, so it is written to %TEMP% once per process and reused.
+    _CACHE_HELPER_PS1 = '''
+$code = @"
+using System;
+using System.Runtime.InteropServices;
+public class CacheHelper {
+    [DllImport("kernel32.dll", SetLastError = true)]
+    public static extern bool SetSystemFileCacheSize(int MinimumFileCacheSize, int MaximumFileCacheSize, int Flags);
+}
+"@
+if (-not ('CacheHelper' -as [type])) { Add-Type -TypeDefinition $code -Language CSharp }
+[CacheHelper]::SetSystemFileCacheSize(-1, -1, 0)
+'''
+    _CACHE_HELPER_PS1_PATH = None
+    
+    # Long-lived PowerShell interpreter shared by all PowerShell steps, so the
+    # 300-800 ms startup cost is paid once per process rather than per command
+    _PS_SENTINEL = '---END---'
+    _ps_proc = None
+    _ps_lines = None
+    _ps_lock = threading.Lock()
+    
+    @classmethod
+    def _get_ps_proc(cls):
+        """Start the shared PowerShell process on first use, or restart it if it exited"""
+        global _ps_close_registered
+        proc = SystemOptimizer._ps_proc
+        if proc is None or proc.poll() is not None:
+            proc = subprocess.Popen(
+                ['powershell', '-NoProfile', '-NonInteractive', '-ExecutionPolicy', 'Bypass', '-Command', '-'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True
+            )
+            # Pipes can't be read with a timeout on Windows, so a reader thread
+            # forwards output lines and _run_ps waits on the queue instead
+            lines = queue.Queue()
+            threading.Thread(target=cls._pump_ps_output, args=(proc.stdout, lines), daemon=True).start()
+            if not _ps_close_registered:
+                atexit.register(cls._close_ps_proc)
+                _ps_close_registered = True
+            SystemOptimizer._ps_proc = proc
+            SystemOptimizer._ps_lines = lines
+        return proc
+    
+    @staticmethod
+    def _pump_ps_output(stream, lines):
+        """Forward PowerShell output lines to a queue, ending with None on exit"""
+        try:
+            for out_line in stream:
+                lines.put(out_line)
+        finally:
+            lines.put(None)
+    
+    @classmethod
+    def _close_ps_proc(cls):
+        """Shut down the shared PowerShell process"""
+        proc = SystemOptimizer._ps_proc
+        if proc is not None and proc.poll() is None:
+            try:
+                proc.stdin.write("exit\n")
+                proc.stdin.flush()
+                proc.wait(timeout=2)
+            except Exception:
+                proc.kill()
+    
+    @classmethod
+    def _run_ps(cls, script, timeout=_PS_TIMEOUT):
+        """Run a PowerShell script in the shared interpreter and return (success, output)"""
+        # Reading scripts from stdin is line-oriented, so ship each one as a
+        # single base64-encoded line and report failures through the sentinel.
+        # The script block keeps $ErrorActionPreference local to this script
+        # instead of leaking into the shared session.
+        encoded = base64.b64encode(script.encode('utf-8')).decode('ascii')
+        line = (
+            "try { & { $ErrorActionPreference = 'Stop'; "
+            f"Invoke-Expression ([Text.Encoding]::UTF8.GetString([Convert]::FromBase64String('{encoded}'))) | Out-String }}; "
+            f"Write-Output '{cls._PS_SENTINEL}0' }} "
+            f"catch {{ Write-Output $_.Exception.Message; Write-Output '{cls._PS_SENTINEL}1' }}\n"
+        )
+        with SystemOptimizer._ps_lock:
+            try:
+                proc = cls._get_ps_proc()
+                lines = SystemOptimizer._ps_lines
+                proc.stdin.write(line)
+                proc.stdin.flush()
+                output = []
+                deadline = time.monotonic() + timeout
+                while True:
+                    try:
+                        out_line = lines.get(timeout=max(0.0, deadline - time.monotonic()))
+                    except queue.Empty:
+                        # A hung step must not hold the lock forever; kill the
+                        # interpreter so the next call starts a fresh one
+                        proc.kill()
+                        SystemOptimizer._ps_proc = None
+                        logger.error(f"Command failed: PowerShell step timed out after {timeout}s")
+                        return False, "timed out"
+                    if out_line is None:
+                        break
+                    if out_line.startswith(cls._PS_SENTINEL):
+                        result = ''.join(output)
+                        if out_line.strip() == f"{cls._PS_SENTINEL}0":
+                            return True, result
+                        logger.error(f"Command failed: {result}")
+                        return False, result
+                    output.append(out_line)
+            except OSError as e:
+                logger.error(f"Command failed: {str(e)}")
+                return False, str(e)
+            # The interpreter exited before printing the sentinel
+            SystemOptimizer._ps_proc = None
+            logger.error("Command failed: PowerShell process exited")
+            return False, "PowerShell process exited"
+    
+    @classmethod
+    def _ensure_ps_script(cls):
+        """Write the cache helper script on first use and return its path"""
+        path = SystemOptimizer._CACHE_HELPER_PS1_PATH
+        if path is None or not os.path.exists(path):
+            path = os.path.join(os.environ.get('TEMP', ''), 'vmem_cache_helper.ps1')
+            with open(path, 'w') as f:
+                f.write(cls._CACHE_HELPER_PS1)
+            SystemOptimizer._CACHE_HELPER_PS1_PATH = path
+        return path
+    
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def is_admin():
-        """Check if the application is running with admin privileges"""
+        """Check if the application is running with admin privileges
+
+        Admin status cannot change during the process lifetime, so the
+        result is cached after the first call.
+        """
         try:
             return ctypes.windll.shell32.IsUserAnAdmin() != 0
         except Exception as e:
@@ -23,9 +263,24 @@ class SystemOptimizer:
             return False
             
     @staticmethod
-    def run_command(cmd, shell=True):
-        """Run a system command and return the output"""
+    def run_command(cmd, shell=True, capture_output=True):
+        """Run a system command and return the output
+
+        When capture_output is False the command's output is discarded
+        instead of being piped back and decoded; use it for callers that
+        only check the success flag.
+        """
         try:
+            if not capture_output:
+                subprocess.run(
+                    cmd,
+                    shell=shell,
+                    check=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
+                return True, ''
+            
             result = subprocess.run(
                 cmd, 
                 shell=shell, 
@@ -36,14 +291,19 @@ class SystemOptimizer:
             )
             return True, result.stdout
         except subprocess.CalledProcessError as e:
-            logger.error(f"Command failed: {e.stderr}")
-            return False, e.stderr
+            error = e.stderr if capture_output else f"exit code {e.returncode}"
+            logger.error(f"Command failed: {error}")
+            return False, error
         except Exception as e:
             logger.error(f"Error running command: {str(e)}")
             return False, str(e)
 
 
 class MemoryStats:
+    # A fresh instance is built on every poll, so skip the per-instance dict
+    __slots__ = ('total', 'available', 'used', 'free', 'percent',
+                 'swap_total', 'swap_used', 'swap_free', 'swap_percent', 'timestamp')
+
     def __init__(self):
         self.total = 0
         self.available = 0
@@ -100,7 +360,7 @@ class MemoryOptimizer(SystemOptimizer):
     """Class to handle real memory optimization"""
     
     _optimization_performed = False
-    last_optimization_details = []
+    last_optimization_details = DetailsLog()
     
     @classmethod
     def optimize(cls):
@@ -112,7 +372,7 @@ class MemoryOptimizer(SystemOptimizer):
     def optimize_with_details(cls):
         """Perform memory optimization and return detailed results"""
         try:
-            cls.last_optimization_details = []
+            cls.last_optimization_details = DetailsLog()
             cls._optimization_performed = True
             
             if not cls.is_admin():
@@ -122,18 +382,18 @@ class MemoryOptimizer(SystemOptimizer):
             return cls._optimize_windows_with_details()
         except Exception as e:
             logger.error(f"Error in memory optimization: {str(e)}")
-            cls.last_optimization_details.append(("Error", str(e)))
+            cls.last_optimization_details.append("Error", str(e))
             return False, str(e), cls.last_optimization_details
     
     @classmethod
     def _perform_user_level_optimizations_with_details(cls):
         """Perform optimizations that don't require admin privileges"""
         try:
-            details = []
+            details = DetailsLog()
             
             # Get initial memory stats
             initial_stats = MemoryStats.get_current()
-            details.append(("Initial memory usage", f"{initial_stats.percent:.1f}%"))
+            details.append("Initial memory usage", f"{initial_stats.percent:.1f}%")
             
             # Clear temp files
             temp_files_result = cls._clear_user_temp_files_with_details()
@@ -141,21 +401,21 @@ class MemoryOptimizer(SystemOptimizer):
             
             # Final memory stats
             final_stats = MemoryStats.get_current()
-            details.append(("Final memory usage", f"{final_stats.percent:.1f}%"))
+            details.append("Final memory usage", f"{final_stats.percent:.1f}%")
             improvement = final_stats.percent - initial_stats.percent
-            details.append(("Memory usage change", f"{improvement:.1f}% ({'-' if improvement < 0 else '+'}{abs(improvement):.1f}%)"))
+            details.append("Memory usage change", f"{improvement:.1f}% ({'-' if improvement < 0 else '+'}{abs(improvement):.1f}%)")
             
             cls.last_optimization_details = details
             return True, "Limited memory optimization completed (without administrator privileges)", details
         except Exception as e:
             logger.error(f"Error in user-level memory optimization: {str(e)}")
-            cls.last_optimization_details.append(("Error", str(e)))
+            cls.last_optimization_details.append("Error", str(e))
             return False, str(e), cls.last_optimization_details
     
     @classmethod
     def _clear_user_temp_files_with_details(cls):
         """Clear temp files accessible to the user with detailed logging"""
-        details = []
+        details = DetailsLog()
         try:
             # Get user temp directory
             temp_paths = []
@@ -164,7 +424,7 @@ class MemoryOptimizer(SystemOptimizer):
             for var in ['TEMP', 'TMP']:
                 if var in os.environ and os.path.exists(os.environ[var]):
                     temp_paths.append(os.environ[var])
-                    details.append(("Found temp directory", os.environ[var]))
+                    details.append("Found temp directory", os.environ[var])
             
             # Add Windows-specific temp locations
             home = os.path.expanduser("~")
@@ -173,21 +433,21 @@ class MemoryOptimizer(SystemOptimizer):
             win_temp = os.path.join(home, 'AppData', 'Local', 'Temp')
             if os.path.exists(win_temp):
                 temp_paths.append(win_temp)
-                details.append(("Found Windows temp directory", win_temp))
+                details.append("Found Windows temp directory", win_temp)
             
             # Clear files in accessible temp directories
             total_cleared = 0
             for temp_path in temp_paths:
                 cleared_files = cls._safely_clear_temp_directory_with_details(temp_path)
                 total_cleared += cleared_files
-                details.append(("Cleared temp files", f"{cleared_files} files from {temp_path}"))
+                details.append("Cleared temp files", f"{cleared_files} files from {temp_path}")
             
-            details.append(("Total files cleared", f"{total_cleared} files from {len(temp_paths)} directories"))
+            details.append("Total files cleared", f"{total_cleared} files from {len(temp_paths)} directories")
             logger.info(f"Cleared user-accessible temp files in {len(temp_paths)} directories")
             return details
         except Exception as e:
             logger.error(f"Error clearing user temp files: {str(e)}")
-            details.append(("Error clearing temp files", str(e)))
+            details.append("Error clearing temp files", str(e))
             return details
     
     @classmethod
@@ -198,23 +458,20 @@ class MemoryOptimizer(SystemOptimizer):
         
         count = 0
         try:
-            # Get list of files sorted by modification time (oldest first)
+            # Get list of files with their modification times
             files = []
-            for item in os.listdir(directory):
-                item_path = os.path.join(directory, item)
-                if os.path.isfile(item_path):
+            with os.scandir(directory) as entries:
+                for entry in entries:
                     try:
-                        mtime = os.path.getmtime(item_path)
-                        files.append((item_path, mtime))
-                    except Exception:
+                        if entry.is_file(follow_symlinks=False):
+                            files.append((entry.path, entry.stat(follow_symlinks=False).st_mtime))
+                    except OSError:
                         # Skip files we can't get info about
                         continue
             
-            files.sort(key=lambda x: x[1])  # Sort by modification time
-            files = [f[0] for f in files]  # Get just the paths
-            
-            # Clear oldest files first, up to max_files
-            for file_path in files[:max_files]:
+            # Clear oldest files first, up to max_files; a bounded heap avoids
+            # sorting the whole listing when only the oldest few are needed
+            for file_path, _ in heapq.nsmallest(max_files, files, key=operator.itemgetter(1)):
                 try:
                     # Try to remove the file
                     os.remove(file_path)
@@ -242,15 +499,17 @@ class MemoryOptimizer(SystemOptimizer):
             for proc in psutil.process_iter(['pid', 'name', 'memory_percent', 'status']):
                 try:
                     # Skip system critical processes
-                    if proc.name().lower() in ['system', 'registry', 'smss.exe', 'csrss.exe', 'wininit.exe', 'services.exe', 'lsass.exe', 'winlogon.exe']:
+                    name = proc.name()
+                    if name.lower() in _CRITICAL_PROCESSES:
                         continue
                     
                     # Check if process is using significant memory (>5%)
-                    if proc.memory_percent() > 5:
+                    memory_percent = proc.memory_percent()
+                    if memory_percent > 5:
                         high_memory_processes.append({
                             'pid': proc.pid,
-                            'name': proc.name(),
-                            'memory_percent': proc.memory_percent(),
+                            'name': name,
+                            'memory_percent': memory_percent,
                             'status': proc.status()
                         })
                 except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
@@ -266,17 +525,25 @@ class MemoryOptimizer(SystemOptimizer):
         """Identify potentially corrupted files in a directory"""
         corrupted_files = []
         try:
+            kernel32 = _load_probe_kernel32()
+            buffer = ctypes.create_string_buffer(_PROBE_SIZE) if kernel32 else None
             for root, _, files in os.walk(directory):
                 for file in files:
                     file_path = os.path.join(root, file)
+                    if kernel32:
+                        # Probe through Win32 directly to skip buffered-IO setup
+                        error = cls._probe_file_win32(kernel32, file_path, buffer)
+                        if error:
+                            corrupted_files.append((file_path, error))
+                        continue
                     try:
                         # Check if file is readable
                         with open(file_path, 'rb') as f:
                             # Try to read first and last 1024 bytes
                             f.seek(0)
-                            f.read(1024)
-                            f.seek(-1024, 2)
-                            f.read(1024)
+                            f.read(_PROBE_SIZE)
+                            f.seek(-_PROBE_SIZE, 2)
+                            f.read(_PROBE_SIZE)
                     except (IOError, OSError) as e:
                         # File might be corrupted if we can't read it
                         corrupted_files.append((file_path, str(e)))
@@ -285,14 +552,73 @@ class MemoryOptimizer(SystemOptimizer):
         
         return corrupted_files
 
+    @staticmethod
+    def _probe_file_win32(kernel32, file_path, buffer):
+        """Read the first and last bytes of a file, returning an error string or None"""
+        handle = kernel32.CreateFileW(file_path, _GENERIC_READ, _FILE_SHARE_ALL, None,
+                                      _OPEN_EXISTING, _FILE_FLAG_SEQUENTIAL_SCAN, None)
+        if handle is None or handle == _INVALID_HANDLE_VALUE:
+            return str(ctypes.WinError(ctypes.get_last_error()))
+        try:
+            bytes_read = ctypes.c_uint32()
+            # Seeking before the start fails just like f.seek(-1024, 2) does
+            if not (kernel32.ReadFile(handle, buffer, _PROBE_SIZE, ctypes.byref(bytes_read), None)
+                    and kernel32.SetFilePointerEx(handle, -_PROBE_SIZE, None, _FILE_END)
+                    and kernel32.ReadFile(handle, buffer, _PROBE_SIZE, ctypes.byref(bytes_read), None)):
+                return str(ctypes.WinError(ctypes.get_last_error()))
+            return None
+        finally:
+            kernel32.CloseHandle(handle)
+
+    @classmethod
+    def _system_gc_with_details(cls):
+        """Run the .NET garbage collector and return a detail entry"""
+        try:
+            success, output = cls._run_ps('[GC]::Collect(); [GC]::WaitForPendingFinalizers()')
+            if success:
+                return ("System garbage collection", "Success")
+            return ("System garbage collection", f"Failed: {output}")
+        except Exception as e:
+            return ("System garbage collection", f"Error: {str(e)}")
+
+    @classmethod
+    def _optimize_working_set_with_details(cls):
+        """Trim this process's working set and return a detail entry"""
+        try:
+            # $pid in the shared PowerShell would only cap that interpreter, so
+            # call Win32 directly; -1/-1 trims once without leaving a limit
+            kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+            kernel32.GetCurrentProcess.restype = ctypes.c_void_p
+            kernel32.SetProcessWorkingSetSize.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_size_t]
+            kernel32.SetProcessWorkingSetSize.restype = ctypes.c_int
+            trim = ctypes.c_size_t(-1).value
+            if kernel32.SetProcessWorkingSetSize(kernel32.GetCurrentProcess(), trim, trim):
+                return ("Working set optimization", "Success")
+            return ("Working set optimization", f"Failed: Windows error {ctypes.get_last_error()}")
+        except Exception as e:
+            return ("Working set optimization", f"Error: {str(e)}")
+
+    @classmethod
+    def _clear_file_system_cache_with_details(cls):
+        """Clear the file system cache and return a detail entry"""
+        try:
+            temp_script = cls._ensure_ps_script()
+            success, output = cls._run_ps(f"& '{temp_script}'")
+            
+            if success:
+                return ("File system cache cleared", "Success")
+            return ("File system cache cleared", f"Failed: {output}")
+        except Exception as e:
+            return ("File system cache", f"Error: {str(e)}")
+
     @classmethod
     def _optimize_windows_with_details(cls):
         """Optimize memory on Windows with detailed logging"""
-        details = []
+        details = DetailsLog()
         try:
             # Get initial memory stats
             initial_stats = MemoryStats.get_current()
-            details.append(("Initial memory usage", f"{initial_stats.percent:.1f}%"))
+            details.append("Initial memory usage", f"{initial_stats.percent:.1f}%")
             
             # Run user-level optimizations
             user_optimization = cls._perform_user_level_optimizations_with_details()
@@ -302,10 +628,10 @@ class MemoryOptimizer(SystemOptimizer):
                 # Identify and handle unnecessary processes
                 high_memory_processes = cls._identify_unnecessary_processes()
                 if high_memory_processes:
-                    details.append(("High memory processes found", str(len(high_memory_processes))))
+                    details.append("High memory processes found", str(len(high_memory_processes)))
                     for proc in high_memory_processes:
-                        details.append((f"Process {proc['name']} (PID: {proc['pid']})", 
-                                      f"Memory usage: {proc['memory_percent']:.1f}%"))
+                        details.append(f"Process {proc['name']} (PID: {proc['pid']})", 
+                                      f"Memory usage: {proc['memory_percent']:.1f}%")
                 
                 # Scan for corrupted files in temp directories
                 temp_dirs = [os.environ.get('TEMP'), os.environ.get('TMP')]
@@ -318,83 +644,31 @@ class MemoryOptimizer(SystemOptimizer):
                             for file_path, error in corrupted_files:
                                 try:
                                     os.remove(file_path)
-                                    details.append(("Removed corrupted file", file_path))
+                                    details.append("Removed corrupted file", file_path)
                                 except Exception as e:
-                                    details.append(("Failed to remove corrupted file", f"{file_path}: {str(e)}"))
+                                    details.append("Failed to remove corrupted file", f"{file_path}: {str(e)}")
                 
                 if total_corrupted > 0:
-                    details.append(("Total corrupted files found", str(total_corrupted)))
-                
-                # Windows memory optimization using built-in commands
-                try:
-                    ps_cmd = 'powershell -NoProfile -Command "[GC]::Collect(); [GC]::WaitForPendingFinalizers()"'
-                    success, output = cls.run_command(ps_cmd)
-                    if success:
-                        details.append(("System garbage collection", "Success"))
-                    else:
-                        details.append(("System garbage collection", f"Failed: {output}"))
-                except Exception as e:
-                    details.append(("System garbage collection", f"Error: {str(e)}"))
+                    details.append("Total corrupted files found", str(total_corrupted))
                 
-                # Clear system working set
-                try:
-                    vm = psutil.virtual_memory()
-                    min_ws = 1024 * 1024  # 1MB minimum
-                    max_ws = vm.available // 2  # Half of available memory
-                    
-                    ps_cmd = f'powershell -NoProfile -Command "$proc = Get-Process -Id $pid; $proc.MinWorkingSet = [IntPtr]::new({min_ws}); $proc.MaxWorkingSet = [IntPtr]::new({max_ws})"'
-                    success, output = cls.run_command(ps_cmd)
-                    if success:
-                        details.append(("Working set optimization", "Success"))
-                    else:
-                        details.append(("Working set optimization", f"Failed: {output}"))
-                except Exception as e:
-                    details.append(("Working set optimization", f"Error: {str(e)}"))
-                
-                # Clear file system cache
-                try:
-                    ps_script = '''
-                    $code = @"
-                    using System;
-                    using System.Runtime.InteropServices;
-                    public class CacheHelper {
-                        [DllImport("kernel32.dll", SetLastError = true)]
-                        public static extern bool SetSystemFileCacheSize(int MinimumFileCacheSize, int MaximumFileCacheSize, int Flags);
-                    }
-"@
-                    Add-Type -TypeDefinition $code -Language CSharp
-                    [CacheHelper]::SetSystemFileCacheSize(-1, -1, 0)
-                    '''
-                    
-                    temp_script = os.path.join(os.environ.get('TEMP', ''), 'clear_cache.ps1')
-                    with open(temp_script, 'w') as f:
-                        f.write(ps_script)
-                    
-                    success, output = cls.run_command(f'powershell -NoProfile -ExecutionPolicy Bypass -File "{temp_script}"')
-                    
-                    try:
-                        os.remove(temp_script)
-                    except:
-                        pass
-                    
-                    if success:
-                        details.append(("File system cache cleared", "Success"))
-                    else:
-                        details.append(("File system cache cleared", f"Failed: {output}"))
-                except Exception as e:
-                    details.append(("File system cache", f"Error: {str(e)}"))
+                # Windows memory optimization using built-in commands. All three
+                # steps run in the shared PowerShell interpreter, which is
+                # already warm after the first one.
+                details.append(*cls._system_gc_with_details())
+                details.append(*cls._optimize_working_set_with_details())
+                details.append(*cls._clear_file_system_cache_with_details())
             
             # Final memory stats
             final_stats = MemoryStats.get_current()
-            details.append(("Final memory usage", f"{final_stats.percent:.1f}%"))
+            details.append("Final memory usage", f"{final_stats.percent:.1f}%")
             improvement = final_stats.percent - initial_stats.percent
-            details.append(("Memory usage change", f"{improvement:.1f}% ({'-' if improvement < 0 else '+'}{abs(improvement):.1f}%)"))
+            details.append("Memory usage change", f"{improvement:.1f}% ({'-' if improvement < 0 else '+'}{abs(improvement):.1f}%)")
             
             cls.last_optimization_details = details
             return True, "Memory optimization completed successfully", details
         except Exception as e:
             logger.error(f"Error in Windows memory optimization: {str(e)}")
-            details.append(("Error", str(e)))
+            details.append("Error", str(e))
             cls.last_optimization_details = details
             return False, f"Error in Windows memory optimization: {str(e)}", details
 
@@ -405,6 +679,16 @@ class MemoryOptimizer(SystemOptimizer):
 
 
 class CacheStats:
+    # Real stats are refreshed at most every 100 ms; the underlying counters
+    # don't change meaningfully faster than that, so faster polls reuse the
+    # last snapshot.
+    _MIN_REFRESH_NS = 100_000_000
+    _SNAPSHOT_FIELDS = ('hits', 'misses', 'hit_ratio', 'access_time',
+                        'eviction_rate', 'write_back_rate', 'timestamp')
+    _last_refresh_ns = 0
+    _last_snapshot = None
+    __slots__ = _SNAPSHOT_FIELDS + ('_last_memory_info', '_last_timestamp')
+    
     def __init__(self):
         self.hits = 0
         self.misses = 0
@@ -416,14 +700,22 @@ class CacheStats:
         self._last_memory_info = None
         self._last_timestamp = None
     
-    def get_real_cache_stats(self):
+    def get_real_cache_stats(self, fresh=False):
         """Get real cache statistics from Windows system"""
+        cls = type(self)
+        now_ns = time.monotonic_ns()
+        # Before/after measurements pass fresh=True so they never share a snapshot
+        if not fresh and cls._last_snapshot is not None and now_ns - cls._last_refresh_ns < cls._MIN_REFRESH_NS:
+            for name, value in zip(cls._SNAPSHOT_FIELDS, cls._last_snapshot):
+                setattr(self, name, value)
+            return True
+        
         try:
             current_time = datetime.now()
             memory_info = psutil.virtual_memory()
             
             # Get Windows system performance metrics
-            process = psutil.Process()
+            process = _get_current_process()
             io_counters = process.io_counters()
             
             # Calculate real cache performance metrics
@@ -485,6 +777,9 @@ class CacheStats:
             
             # Update timestamp
             self.timestamp = current_time
+            
+            cls._last_snapshot = tuple(getattr(self, name) for name in cls._SNAPSHOT_FIELDS)
+            cls._last_refresh_ns = now_ns
             return True
         except Exception as e:
             logger.error(f"Error getting real cache stats: {str(e)}")
@@ -520,10 +815,10 @@ class CacheStats:
             return False
     
     @classmethod
-    def get_current(cls):
-        """Get current cache statistics"""
+    def get_current(cls, fresh=False):
+        """Get current cache statistics; fresh=True bypasses the shared snapshot"""
         stats = cls()
-        if not stats.get_real_cache_stats():
+        if not stats.get_real_cache_stats(fresh):
             stats._get_simulated_cache_stats()
         return stats
     
@@ -544,7 +839,7 @@ class CacheOptimizer(SystemOptimizer):
     """Class to handle real cache optimization"""
     
     _optimization_performed = False
-    last_optimization_details = []
+    last_optimization_details = DetailsLog()
     
     @classmethod
     def optimize(cls):
@@ -556,7 +851,7 @@ class CacheOptimizer(SystemOptimizer):
     def optimize_with_details(cls):
         """Perform cache optimization based on the current OS with detailed results"""
         try:
-            cls.last_optimization_details = []
+            cls.last_optimization_details = DetailsLog()
             cls._optimization_performed = True
             
             if not cls.is_admin():
@@ -566,19 +861,19 @@ class CacheOptimizer(SystemOptimizer):
             return cls._optimize_windows_with_details()
         except Exception as e:
             logger.error(f"Error in cache optimization: {str(e)}")
-            cls.last_optimization_details.append(("Error", str(e)))
+            cls.last_optimization_details.append("Error", str(e))
             return False, str(e), cls.last_optimization_details
     
     @classmethod
     def _perform_user_level_optimizations_with_details(cls):
         """Perform cache optimizations that don't require admin privileges"""
         try:
-            details = []
+            details = DetailsLog()
             
             # Get initial cache stats
-            initial_stats = CacheStats.get_current()
+            initial_stats = CacheStats.get_current(fresh=True)
             initial_hit_ratio = initial_stats.hit_ratio
-            details.append(("Initial cache hit ratio", f"{initial_hit_ratio*100:.1f}%"))
+            details.append("Initial cache hit ratio", f"{initial_hit_ratio*100:.1f}%")
             
             # Browser cache clearing
             browser_results = cls._clear_browser_caches_with_details()
@@ -589,24 +884,24 @@ class CacheOptimizer(SystemOptimizer):
             details.extend(app_cache_results)
             
             # Get final cache stats
-            final_stats = CacheStats.get_current()
+            final_stats = CacheStats.get_current(fresh=True)
             final_hit_ratio = final_stats.hit_ratio
             
-            details.append(("Final cache hit ratio", f"{final_hit_ratio*100:.1f}%"))
+            details.append("Final cache hit ratio", f"{final_hit_ratio*100:.1f}%")
             improvement = ((final_hit_ratio - initial_hit_ratio) / initial_hit_ratio) * 100 if initial_hit_ratio > 0 else 0
-            details.append(("Cache hit ratio improvement", f"{improvement:.1f}%"))
+            details.append("Cache hit ratio improvement", f"{improvement:.1f}%")
             
             cls.last_optimization_details = details
             return True, "Cache optimization completed successfully", details
         except Exception as e:
             logger.error(f"Error in user-level cache optimization: {str(e)}")
-            cls.last_optimization_details.append(("Error", str(e)))
+            cls.last_optimization_details.append("Error", str(e))
             return False, str(e), cls.last_optimization_details
     
     @classmethod
     def _clear_browser_caches_with_details(cls):
         """Clear browser caches with detailed logging"""
-        details = []
+        details = DetailsLog()
         try:
             home = os.path.expanduser("~")
             browser_cache_paths = []
@@ -628,24 +923,24 @@ class CacheOptimizer(SystemOptimizer):
             total_cleared = 0
             for browser_name, cache_path in browser_cache_paths:
                 try:
-                    files_cleared = cls._safely_clear_directory_with_details(cache_path)
-                    details.append((f"Cleared {browser_name}", f"{files_cleared} files"))
+                    files_cleared = cls._safely_clear_directory_with_details(cache_path, recursive=True)
+                    details.append(f"Cleared {browser_name}", f"{files_cleared} files")
                     total_cleared += files_cleared
                 except Exception as e:
-                    details.append((f"Error clearing {browser_name}", str(e)))
+                    details.append(f"Error clearing {browser_name}", str(e))
                     logger.error(f"Error clearing {browser_name} cache: {str(e)}")
             
-            details.append(("Total browser cache files cleared", str(total_cleared)))
+            details.append("Total browser cache files cleared", str(total_cleared))
             return details
         except Exception as e:
             logger.error(f"Error clearing browser caches: {str(e)}")
-            details.append(("Error clearing browser caches", str(e)))
+            details.append("Error clearing browser caches", str(e))
             return details
     
     @classmethod
     def _clear_app_caches_with_details(cls):
         """Clear application caches with detailed logging"""
-        details = []
+        details = DetailsLog()
         try:
             cache_paths = []
             
@@ -653,71 +948,86 @@ class CacheOptimizer(SystemOptimizer):
             for var in ['TEMP', 'TMP']:
                 if var in os.environ and os.path.exists(os.environ[var]):
                     cache_paths.append(os.environ[var])
-                    details.append(("Found cache directory", os.environ[var]))
+                    details.append("Found cache directory", os.environ[var])
             
             # Add Windows-specific cache locations
             home = os.path.expanduser("~")
             win_cache = os.path.join(home, 'AppData', 'Local', 'Microsoft', 'Windows', 'INetCache')
             if os.path.exists(win_cache):
                 cache_paths.append(win_cache)
-                details.append(("Found Windows cache directory", win_cache))
+                details.append("Found Windows cache directory", win_cache)
             
             # Clear files in accessible cache directories
             total_cleared = 0
             for cache_path in cache_paths:
                 cleared_files = cls._safely_clear_directory_with_details(cache_path)
                 total_cleared += cleared_files
-                details.append(("Cleared cache files", f"{cleared_files} files from {cache_path}"))
+                details.append("Cleared cache files", f"{cleared_files} files from {cache_path}")
             
-            details.append(("Total files cleared", f"{total_cleared} files from {len(cache_paths)} directories"))
+            details.append("Total files cleared", f"{total_cleared} files from {len(cache_paths)} directories")
             logger.info(f"Cleared user-accessible cache files in {len(cache_paths)} directories")
             return details
         except Exception as e:
             logger.error(f"Error clearing application caches: {str(e)}")
-            details.append(("Error clearing application caches", str(e)))
+            details.append("Error clearing application caches", str(e))
             return details
     
+    @staticmethod
+    def _unlink_file(file_path):
+        """Remove a single file, returning True if it was deleted"""
+        try:
+            # Files in use raise PermissionError (WinError 32 sharing violation on Windows)
+            os.unlink(file_path)
+            return True
+        except PermissionError:
+            # File is in use or protected
+            logger.debug(f"Skipped file {file_path}: Permission denied")
+            return False
+        except Exception as e:
+            # Log other errors but continue
+            logger.debug(f"Skipped file {file_path}: {str(e)}")
+            return False
+    
     @classmethod
-    def _safely_clear_directory_with_details(cls, directory, max_files=1000):
+    def _iter_files(cls, root, recursive=False):
+        """Yield (path, mtime) for the files in root, and in nested folders if recursive"""
+        stack = [root]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                # Only browser caches nest their files; other
+                                # folders may hold other applications' data
+                                if recursive:
+                                    stack.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                yield entry.path, entry.stat(follow_symlinks=False).st_mtime
+                        except OSError:
+                            # Skip files we can't get info about
+                            continue
+            except OSError:
+                # Skip subdirectories we can't list
+                continue
+    
+    @classmethod
+    def _safely_clear_directory_with_details(cls, directory, max_files=1000, recursive=False):
         """Safely clear files in a directory with details"""
         if not os.path.exists(directory) or not os.path.isdir(directory):
             return 0
         
-        count = 0
         try:
-            # Get list of files sorted by modification time (oldest first)
-            files = []
-            for item in os.listdir(directory):
-                item_path = os.path.join(directory, item)
-                if os.path.isfile(item_path):
-                    try:
-                        mtime = os.path.getmtime(item_path)
-                        files.append((item_path, mtime))
-                    except Exception:
-                        # Skip files we can't get info about
-                        continue
+            # Clear oldest files first, up to max_files; a bounded heap over the
+            # streamed listing avoids sorting when only the oldest few are needed
+            files = cls._iter_files(directory, recursive)
+            paths = [path for path, _ in heapq.nsmallest(max_files, files, key=operator.itemgetter(1))]
+            if not paths:
+                return 0
             
-            files.sort(key=lambda x: x[1])  # Sort by modification time
-            files = [f[0] for f in files]  # Get just the paths
-            
-            # Clear oldest files first, up to max_files
-            for file_path in files[:max_files]:
-                try:
-                    # Skip if file is in use
-                    if cls._is_file_in_use(file_path):
-                        continue
-                    
-                    # Try to remove the file
-                    os.remove(file_path)
-                    count += 1
-                except PermissionError:
-                    # File is in use or protected
-                    logger.debug(f"Skipped file {file_path}: Permission denied")
-                    continue
-                except Exception as e:
-                    # Log other errors but continue
-                    logger.debug(f"Skipped file {file_path}: {str(e)}")
-                    continue
+            # Unlink calls release the GIL, so overlapping them hides per-file latency
+            with ThreadPoolExecutor(max_workers=min(_UNLINK_WORKERS, len(paths))) as executor:
+                count = sum(executor.map(cls._unlink_file, paths))
             
             logger.info(f"Cleared {count} files from {directory}")
             return count
@@ -725,58 +1035,61 @@ class CacheOptimizer(SystemOptimizer):
             logger.error(f"Error clearing directory {directory}: {str(e)}")
             return 0
     
-    @staticmethod
-    def _is_file_in_use(file_path):
-        """Check if a file is currently in use"""
-        try:
-            # Try to open the file in exclusive mode
-            with open(file_path, 'rb+') as f:
-                return False
-        except:
-            return True
-
+    @classmethod
+    def _clear_directories_concurrently(cls, directories, recursive=False):
+        """Clear independent directories in parallel, returning counts in input order"""
+        if not directories:
+            return []
+        clear = functools.partial(cls._safely_clear_directory_with_details, recursive=recursive)
+        # Directory clearing is I/O-bound and scandir/remove release the GIL
+        with ThreadPoolExecutor(max_workers=min(_CLEAR_WORKERS, len(directories))) as executor:
+            return list(executor.map(clear, directories))
+    
     @classmethod
     def _clear_system_cache(cls):
         """Clear various Windows system caches"""
-        details = []
+        details = DetailsLog()
         try:
             # Clear DNS cache
-            success, output = cls.run_command('ipconfig /flushdns')
+            success, output = cls.run_command('ipconfig /flushdns', capture_output=False)
             if success:
-                details.append(("DNS cache cleared", "Success"))
+                details.append("DNS cache cleared", "Success")
             else:
-                details.append(("DNS cache clearing", f"Failed: {output}"))
+                details.append("DNS cache clearing", f"Failed: {output}")
 
             # Clear Windows Store cache
             store_cache = os.path.expanduser(r"~\AppData\Local\Packages\Microsoft.WindowsStore_8wekyb3d8bbwe\LocalCache")
             if os.path.exists(store_cache):
                 cleared = cls._safely_clear_directory_with_details(store_cache)
-                details.append(("Windows Store cache", f"Cleared {cleared} files"))
+                details.append("Windows Store cache", f"Cleared {cleared} files")
 
             # Clear Windows thumbnail cache
             thumb_cache = os.path.expanduser(r"~\AppData\Local\Microsoft\Windows\Explorer")
             if os.path.exists(thumb_cache):
                 cleared = cls._safely_clear_directory_with_details(thumb_cache)
-                details.append(("Thumbnail cache", f"Cleared {cleared} files"))
+                details.append("Thumbnail cache", f"Cleared {cleared} files")
 
             # Clear Windows font cache
-            success, output = cls.run_command('net stop "Windows Font Cache Service" && net start "Windows Font Cache Service"')
+            success, output = cls.run_command('net stop "Windows Font Cache Service" && net start "Windows Font Cache Service"', capture_output=False)
             if success:
-                details.append(("Font cache service", "Reset successfully"))
+                details.append("Font cache service", "Reset successfully")
             else:
-                details.append(("Font cache service", f"Reset failed: {output}"))
+                details.append("Font cache service", f"Reset failed: {output}")
 
             return details
         except Exception as e:
             logger.error(f"Error clearing system cache: {str(e)}")
-            details.append(("System cache clearing error", str(e)))
+            details.append("System cache clearing error", str(e))
             return details
 
     @classmethod
     def _clear_browser_caches(cls):
         """Clear browser caches more thoroughly"""
-        details = []
+        details = DetailsLog()
         try:
+            # (label, result template, path) for each cache found
+            targets = []
+            
             # Chrome cache
             chrome_cache_paths = [
                 os.path.expanduser(r"~\AppData\Local\Google\Chrome\User Data\Default\Cache"),
@@ -786,8 +1099,7 @@ class CacheOptimizer(SystemOptimizer):
             
             for path in chrome_cache_paths:
                 if os.path.exists(path):
-                    cleared = cls._safely_clear_directory_with_details(path)
-                    details.append(("Chrome cache", f"Cleared {cleared} files from {os.path.basename(path)}"))
+                    targets.append(("Chrome cache", "Cleared {} files from " + os.path.basename(path), path))
 
             # Firefox cache
             firefox_profile = os.path.expanduser(r"~\AppData\Local\Mozilla\Firefox\Profiles")
@@ -795,25 +1107,28 @@ class CacheOptimizer(SystemOptimizer):
                 for profile in os.listdir(firefox_profile):
                     cache_path = os.path.join(firefox_profile, profile, "cache2")
                     if os.path.exists(cache_path):
-                        cleared = cls._safely_clear_directory_with_details(cache_path)
-                        details.append(("Firefox cache", f"Cleared {cleared} files"))
+                        targets.append(("Firefox cache", "Cleared {} files", cache_path))
 
             # Edge cache
             edge_cache = os.path.expanduser(r"~\AppData\Local\Microsoft\Edge\User Data\Default\Cache")
             if os.path.exists(edge_cache):
-                cleared = cls._safely_clear_directory_with_details(edge_cache)
-                details.append(("Edge cache", f"Cleared {cleared} files"))
+                targets.append(("Edge cache", "Cleared {} files", edge_cache))
+
+            # The caches are independent directories, so clear them concurrently
+            cleared_counts = cls._clear_directories_concurrently([path for _, _, path in targets], recursive=True)
+            for (label, result, _), cleared in zip(targets, cleared_counts):
+                details.append(label, result.format(cleared))
 
             return details
         except Exception as e:
             logger.error(f"Error clearing browser caches: {str(e)}")
-            details.append(("Browser cache clearing error", str(e)))
+            details.append("Browser cache clearing error", str(e))
             return details
 
     @classmethod
     def _clear_windows_temp_cache(cls):
         """Clear Windows temporary cache files"""
-        details = []
+        details = DetailsLog()
         try:
             # Windows Temp directories
             temp_paths = [
@@ -823,32 +1138,42 @@ class CacheOptimizer(SystemOptimizer):
                 r"C:\Windows\Temp"
             ]
 
+            # TEMP and TMP usually point at the same directory; clearing it
+            # twice concurrently would just race, so keep one entry per path
+            existing_paths = []
+            seen = set()
             for temp_path in temp_paths:
                 if temp_path and os.path.exists(temp_path):
-                    cleared = cls._safely_clear_directory_with_details(temp_path)
-                    details.append(("Temporary files", f"Cleared {cleared} files from {temp_path}"))
+                    key = os.path.normcase(os.path.abspath(temp_path))
+                    if key not in seen:
+                        seen.add(key)
+                        existing_paths.append(temp_path)
+
+            cleared_counts = cls._clear_directories_concurrently(existing_paths)
+            for temp_path, cleared in zip(existing_paths, cleared_counts):
+                details.append("Temporary files", f"Cleared {cleared} files from {temp_path}")
 
             # Clear Windows Prefetch
             prefetch_path = r"C:\Windows\Prefetch"
             if os.path.exists(prefetch_path) and cls.is_admin():
                 cleared = cls._safely_clear_directory_with_details(prefetch_path)
-                details.append(("Prefetch files", f"Cleared {cleared} files"))
+                details.append("Prefetch files", f"Cleared {cleared} files")
 
             return details
         except Exception as e:
             logger.error(f"Error clearing Windows temp cache: {str(e)}")
-            details.append(("Temp cache clearing error", str(e)))
+            details.append("Temp cache clearing error", str(e))
             return details
 
     @classmethod
     def _optimize_windows_with_details(cls):
         """Optimize cache on Windows systems with detailed logging"""
-        details = []
+        details = DetailsLog()
         try:
             # Get initial cache stats
-            initial_stats = CacheStats.get_current()
+            initial_stats = CacheStats.get_current(fresh=True)
             initial_hit_ratio = initial_stats.hit_ratio
-            details.append(("Initial cache hit ratio", f"{initial_hit_ratio*100:.1f}%"))
+            details.append("Initial cache hit ratio", f"{initial_hit_ratio*100:.1f}%")
             
             # Clear system caches
             system_cache_results = cls._clear_system_cache()
@@ -865,66 +1190,45 @@ class CacheOptimizer(SystemOptimizer):
             if cls.is_admin():
                 # Clear system working set
                 try:
-                    ps_cmd = '''powershell -NoProfile -Command "
+                    ps_script = '''
                         $targets = Get-Process | Where-Object {$_.WorkingSet -gt 100MB}
                         foreach ($target in $targets) {
                             [void]$target.MinWorkingSet(0)
                             [void]$target.MaxWorkingSet(100MB)
-                        }"'''
-                    success, output = cls.run_command(ps_cmd)
+                        }'''
+                    success, output = cls._run_ps(ps_script)
                     if success:
-                        details.append(("Process working sets optimized", "Success"))
+                        details.append("Process working sets optimized", "Success")
                     else:
-                        details.append(("Process working sets", f"Failed: {output}"))
+                        details.append("Process working sets", f"Failed: {output}")
                 except Exception as e:
-                    details.append(("Process working sets", f"Error: {str(e)}"))
+                    details.append("Process working sets", f"Error: {str(e)}")
 
                 # Clear file system cache
                 try:
-                    ps_script = '''
-                    $code = @"
-                    using System;
-                    using System.Runtime.InteropServices;
-                    public class CacheHelper {
-                        [DllImport("kernel32.dll", SetLastError = true)]
-                        public static extern bool SetSystemFileCacheSize(int MinimumFileCacheSize, int MaximumFileCacheSize, int Flags);
-                    }
-"@
-                    Add-Type -TypeDefinition $code -Language CSharp
-                    [CacheHelper]::SetSystemFileCacheSize(-1, -1, 0)
-                    '''
-                    
-                    temp_script = os.path.join(os.environ.get('TEMP', ''), 'clear_cache.ps1')
-                    with open(temp_script, 'w') as f:
-                        f.write(ps_script)
-                    
-                    success, output = cls.run_command(f'powershell -NoProfile -ExecutionPolicy Bypass -File "{temp_script}"')
-                    
-                    try:
-                        os.remove(temp_script)
-                    except:
-                        pass
+                    temp_script = cls._ensure_ps_script()
+                    success, output = cls._run_ps(f"& '{temp_script}'")
                     
                     if success:
-                        details.append(("File system cache cleared", "Success"))
+                        details.append("File system cache cleared", "Success")
                     else:
-                        details.append(("File system cache", f"Failed: {output}"))
+                        details.append("File system cache", f"Failed: {output}")
                 except Exception as e:
-                    details.append(("File system cache", f"Error: {str(e)}"))
+                    details.append("File system cache", f"Error: {str(e)}")
             
             # Get final cache stats
-            final_stats = CacheStats.get_current()
+            final_stats = CacheStats.get_current(fresh=True)
             final_hit_ratio = final_stats.hit_ratio
             
-            details.append(("Final cache hit ratio", f"{final_hit_ratio*100:.1f}%"))
+            details.append("Final cache hit ratio", f"{final_hit_ratio*100:.1f}%")
             improvement = ((final_hit_ratio - initial_hit_ratio) / initial_hit_ratio) * 100 if initial_hit_ratio > 0 else 0
-            details.append(("Cache hit ratio improvement", f"{improvement:.1f}%"))
+            details.append("Cache hit ratio improvement", f"{improvement:.1f}%")
             
             cls.last_optimization_details = details
             return True, "Cache optimization completed successfully", details
         except Exception as e:
             logger.error(f"Error in Windows cache optimization: {str(e)}")
-            details.append(("Error", str(e)))
+            details.append("Error", str(e))
             cls.last_optimization_details = details
             return False, f"Error in Windows cache optimization: {str(e)}", details
 
@@ -935,6 +1239,8 @@ class CacheOptimizer(SystemOptimizer):
 
 
 class PerformanceMetrics:
+    __slots__ = ('response_time', 'throughput', 'page_faults', 'swap_rate', 'timestamp')
+
     def __init__(self):
         self.response_time = 0
         self.throughput = 0
@@ -950,19 +1256,17 @@ class PerformanceMetrics:
             
             # Get page faults from process info
             try:
-                process = psutil.Process()
-                metrics.page_faults = process.memory_info().num_page_faults
+                metrics.page_faults = _get_current_process().memory_info().num_page_faults
             except Exception:
-                metrics.page_faults = np.random.randint(10, 100)
+                metrics.page_faults = random.randrange(10, 100)
             
             # Get swap rate from swap info
             swap = psutil.swap_memory()
             metrics.swap_rate = swap.used / swap.total if swap.total > 0 else 0
             
             # These are hard to get accurately, so simulate them
-            metrics.response_time = np.random.uniform(0.1, 2.0)
-            metrics.throughput = np.random.uniform(1000, 5000)
-            metrics.timestamp = datetime.now()
+            metrics.response_time = random.uniform(0.1, 2.0)
+            metrics.throughput = random.uniform(1000, 5000)
             
             return metrics
         except Exception as e:
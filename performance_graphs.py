@@ -3,9 +3,57 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
 import numpy as np
+from collections import deque
 from datetime import datetime
 
+def _linfit1(y):
+    """Least-squares slope and intercept of y against x = 0..n-1"""
+    n = len(y)
+    # Sums over x = arange(n) have closed forms, so only the y sums need a pass
+    sx = n * (n - 1) / 2
+    sxx = (n - 1) * n * (2 * n - 1) / 6
+    sy = float(y.sum())
+    sxy = float(np.dot(np.arange(n, dtype=np.float64), y))
+    m = (n * sxy - sx * sy) / (n * sxx - sx * sx)
+    b = (sy - m * sx) / n
+    return m, b
+
+class RingBuffer:
+    """Fixed-size float history with O(1) append and copy-free ordered views"""
+    
+    def __init__(self, capacity, dtype=np.float32):
+        self.capacity = capacity
+        # Every sample is written twice, capacity apart, so the logically
+        # ordered window is always one contiguous slice of the buffer
+        self.buf = np.zeros(2 * capacity, dtype=dtype)
+        self.cursor = 0
+        self.count = 0
+        
+    def append(self, value):
+        """Store a sample, overwriting the oldest one once full"""
+        self.buf[self.cursor] = value
+        self.buf[self.cursor + self.capacity] = value
+        self.cursor = (self.cursor + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        
+    def view(self):
+        """Return the samples oldest-first as a view into the buffer"""
+        if self.count < self.capacity:
+            return self.buf[:self.count]
+        return self.buf[self.cursor:self.cursor + self.capacity]
+        
+    def clear(self):
+        """Drop all samples"""
+        self.cursor = 0
+        self.count = 0
+        
+    def __len__(self):
+        return self.count
+
 class PerformanceGraphs(QWidget):
+    CPU_WINDOW = 5
+    MAX_POINTS = 60
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.layout = QVBoxLayout()
@@ -60,159 +108,237 @@ class PerformanceGraphs(QWidget):
         # Set style
         plt.style.use('bmh')
         
-    def update_memory_graph(self, history_data, timestamps):
+        # Create persistent axes and artists, updated in place on each refresh
+        self.memory_ax = self.memory_figure.add_subplot(111)
+        self.memory_line, = self.memory_ax.plot([], [], color='#2ecc71', linewidth=2, label='Usage')
+        self.memory_trend_line, = self.memory_ax.plot([], [], "r--", alpha=0.8, label='Trend')
+        self.memory_fill = None
+        self._memory_buf = RingBuffer(self.MAX_POINTS)
+        self._ts_strs = deque(maxlen=self.MAX_POINTS)
+        self.memory_ax.set_title('Memory Usage Over Time')
+        self.memory_ax.set_ylabel('Memory Usage (%)')
+        self.memory_ax.grid(True, alpha=0.3)
+        self.memory_ax.legend()
+        
+        self.cpu_ax = self.cpu_figure.add_subplot(111)
+        self.cpu_line, = self.cpu_ax.plot([], [], color='#3498db', linewidth=2, label='Usage')
+        self.cpu_avg_line, = self.cpu_ax.plot([], [], 'r--', label='Moving Avg')
+        self.cpu_fill = None
+        self._cpu_buf = RingBuffer(self.MAX_POINTS)
+        self._cpu_window = deque(maxlen=self.CPU_WINDOW)
+        self._cpu_window_sum = 0.0
+        self._cpu_moving_avg = deque(maxlen=self.MAX_POINTS)
+        self.cpu_ax.set_title('CPU Usage Over Time')
+        self.cpu_ax.set_ylabel('CPU Usage (%)')
+        self.cpu_ax.grid(True, alpha=0.3)
+        self.cpu_ax.legend()
+        
+        self.cache_ax = self.cache_figure.add_subplot(111)
+        self.cache_line, = self.cache_ax.plot([], [], color='#e74c3c', linewidth=2, label='Hit Ratio')
+        self.cache_threshold_line = self.cache_ax.axhline(y=80, color='g', linestyle='--', alpha=0.5, label='Efficiency Threshold')
+        self.cache_threshold_line.set_visible(False)
+        self.cache_fill = None
+        self._cache_buf = RingBuffer(self.MAX_POINTS)
+        self.cache_ax.set_title('Cache Hit Ratio Over Time')
+        self.cache_ax.set_ylabel('Hit Ratio (%)')
+        self.cache_ax.grid(True, alpha=0.3)
+        self.cache_ax.legend()
+        
+        self.page_ax = self.page_figure.add_subplot(111)
+        self.page_trend_line, = self.page_ax.plot([], [], "r--", alpha=0.8, label='Trend')
+        self.page_bars = self.page_ax.bar(range(self.MAX_POINTS), np.zeros(self.MAX_POINTS), alpha=0.7)
+        self._page_cmap_lut = plt.cm.RdYlGn_r(np.linspace(0, 1, 256))
+        self._page_buf = RingBuffer(self.MAX_POINTS, dtype=np.float64)
+        self.page_ax.set_title('Page Faults Over Time')
+        self.page_ax.set_ylabel('Page Faults')
+        self.page_ax.grid(True, axis='y', alpha=0.3)
+        self.page_ax.legend()
+        
+    def append_sample(self, memory_percent, cpu_percent, hit_ratio, page_faults, timestamp):
+        """Record one sample for every graph"""
+        self._memory_buf.append(memory_percent)
+        self._cache_buf.append(hit_ratio * 100)
+        self._page_buf.append(page_faults)
+        self.append_cpu(cpu_percent)
+        self.append_timestamp(timestamp)
+        
+    def append_cpu(self, sample):
+        """Feed a new CPU sample into the running moving average"""
+        if len(self._cpu_window) == self.CPU_WINDOW:
+            self._cpu_window_sum -= self._cpu_window[0]
+        self._cpu_buf.append(sample)
+        self._cpu_window.append(sample)
+        self._cpu_window_sum += sample
+        if len(self._cpu_window) == self.CPU_WINDOW:
+            self._cpu_moving_avg.append(self._cpu_window_sum / self.CPU_WINDOW)
+        
+    def append_timestamp(self, timestamp):
+        """Format a new sample timestamp once for the memory graph x-axis"""
+        self._ts_strs.append(timestamp.strftime('%H:%M:%S'))
+        
+    def reset_history(self):
+        """Drop the incrementally maintained graph state"""
+        for buf in (self._memory_buf, self._cpu_buf, self._cache_buf, self._page_buf):
+            buf.clear()
+        self._ts_strs.clear()
+        self._cpu_window.clear()
+        self._cpu_window_sum = 0.0
+        self._cpu_moving_avg.clear()
+        
+    def update_memory_graph(self):
         """Update memory usage over time graph"""
         try:
-            self.memory_figure.clear()
-            ax = self.memory_figure.add_subplot(111)
+            ax = self.memory_ax
             
-            memory_usage = [d['percent'] for d in history_data]
+            memory_usage = self._memory_buf.view()
             
-            # Ensure timestamps and memory_usage have the same length
-            min_len = min(len(timestamps), len(memory_usage))
-            timestamps = timestamps[-min_len:]
-            memory_usage = memory_usage[-min_len:]
+            x = np.arange(len(memory_usage), dtype=np.float32)
             
-            # Create line plot with gradient
-            ax.plot(range(len(memory_usage)), memory_usage, color='#2ecc71', linewidth=2, label='Usage')
-            ax.fill_between(range(len(memory_usage)), memory_usage, alpha=0.2, color='#2ecc71')
+            # Update line plot with gradient
+            self.memory_line.set_data(x, memory_usage)
             
-            # Add trend line
+            # Update trend line
             if len(memory_usage) > 1:
-                z = np.polyfit(range(len(memory_usage)), memory_usage, 1)
-                p = np.poly1d(z)
-                ax.plot(range(len(memory_usage)), p(range(len(memory_usage))), "r--", alpha=0.8, label='Trend')
+                m, b = _linfit1(memory_usage)
+                self.memory_trend_line.set_data(x, m * x + b)
+            else:
+                self.memory_trend_line.set_data([], [])
             
-            ax.set_title('Memory Usage Over Time')
-            ax.set_ylabel('Memory Usage (%)')
-            ax.grid(True, alpha=0.3)
-            ax.legend()
+            ax.relim()
+            if self.memory_fill is not None:
+                self.memory_fill.remove()
+            self.memory_fill = ax.fill_between(x, memory_usage, alpha=0.2, color='#2ecc71')
+            ax.autoscale_view()
             
             # Update stats
-            if memory_usage:
+            if len(memory_usage):
                 current = memory_usage[-1]
-                avg = sum(memory_usage) / len(memory_usage)
+                avg = memory_usage.mean()
                 self.memory_stat.setText(f"Memory: {current:.1f}% (Avg: {avg:.1f}%)")
             
             # Format x-axis
-            ax.set_xticks(range(0, len(memory_usage), max(1, len(memory_usage) // 5)))
-            ax.set_xticklabels([t.strftime('%H:%M:%S') for t in timestamps[::max(1, len(memory_usage) // 5)]], rotation=45)
+            step = max(1, len(memory_usage) // 5)
+            labels = list(self._ts_strs)[::step]
+            ax.set_xticks(range(0, len(memory_usage), step))
+            ax.set_xticklabels(labels, rotation=45)
             
             self.memory_figure.tight_layout()
-            self.memory_canvas.draw()
+            self.memory_canvas.draw_idle()
         except Exception as e:
             print(f"Error updating memory graph: {str(e)}")
         
-    def update_cpu_graph(self, cpu_history):
+    def update_cpu_graph(self):
         """Update CPU usage graph"""
         try:
-            self.cpu_figure.clear()
-            ax = self.cpu_figure.add_subplot(111)
+            ax = self.cpu_ax
             
-            x_range = range(len(cpu_history))
+            cpu_history = self._cpu_buf.view()
+            x_range = np.arange(len(cpu_history), dtype=np.float32)
             
-            # Create line plot with gradient
-            ax.plot(x_range, cpu_history, color='#3498db', linewidth=2, label='Usage')
-            ax.fill_between(x_range, cpu_history, alpha=0.2, color='#3498db')
+            # Update line plot with gradient
+            self.cpu_line.set_data(x_range, cpu_history)
             
-            # Add moving average
-            if len(cpu_history) > 5:
-                window_size = 5
-                moving_avg = np.convolve(cpu_history, np.ones(window_size)/window_size, mode='valid')
-                ax.plot(range(window_size-1, len(cpu_history)), moving_avg, 'r--', label='Moving Avg')
+            # Update moving average, fed incrementally through append_cpu()
+            avg_len = min(len(self._cpu_moving_avg), len(cpu_history) - self.CPU_WINDOW + 1)
+            if len(cpu_history) > self.CPU_WINDOW and avg_len > 0:
+                moving_avg = np.fromiter(self._cpu_moving_avg, dtype=np.float32, count=len(self._cpu_moving_avg))[-avg_len:]
+                self.cpu_avg_line.set_data(np.arange(len(cpu_history) - avg_len, len(cpu_history)), moving_avg)
+            else:
+                self.cpu_avg_line.set_data([], [])
             
-            ax.set_title('CPU Usage Over Time')
-            ax.set_ylabel('CPU Usage (%)')
-            ax.grid(True, alpha=0.3)
-            ax.legend()
+            ax.relim()
+            if self.cpu_fill is not None:
+                self.cpu_fill.remove()
+            self.cpu_fill = ax.fill_between(x_range, cpu_history, alpha=0.2, color='#3498db')
+            ax.autoscale_view()
             
             # Update stats
-            if cpu_history:
+            if len(cpu_history):
                 current = cpu_history[-1]
-                avg = sum(cpu_history) / len(cpu_history)
+                avg = cpu_history.mean()
                 self.cpu_stat.setText(f"CPU: {current:.1f}% (Avg: {avg:.1f}%)")
             
             self.cpu_figure.tight_layout()
-            self.cpu_canvas.draw()
+            self.cpu_canvas.draw_idle()
         except Exception as e:
             print(f"Error updating CPU graph: {str(e)}")
         
-    def update_cache_graph(self, cache_history):
+    def update_cache_graph(self):
         """Update cache performance graph"""
         try:
-            self.cache_figure.clear()
-            ax = self.cache_figure.add_subplot(111)
+            ax = self.cache_ax
             
-            hit_ratios = [d['hit_ratio'] * 100 for d in cache_history]
-            x_range = range(len(hit_ratios))
+            hit_ratios = self._cache_buf.view()
+            x_range = np.arange(len(hit_ratios), dtype=np.float32)
             
-            # Create line plot with gradient
-            ax.plot(x_range, hit_ratios, color='#e74c3c', linewidth=2, label='Hit Ratio')
-            ax.fill_between(x_range, hit_ratios, alpha=0.2, color='#e74c3c')
+            # Update line plot with gradient
+            self.cache_line.set_data(x_range, hit_ratios)
             
-            # Add efficiency threshold line
-            if hit_ratios:
-                threshold = 80
-                ax.axhline(y=threshold, color='g', linestyle='--', alpha=0.5, label='Efficiency Threshold')
+            # Show efficiency threshold line once there is data
+            self.cache_threshold_line.set_visible(bool(len(hit_ratios)))
             
-            ax.set_title('Cache Hit Ratio Over Time')
-            ax.set_ylabel('Hit Ratio (%)')
-            ax.grid(True, alpha=0.3)
-            ax.legend()
+            ax.relim()
+            if self.cache_fill is not None:
+                self.cache_fill.remove()
+            self.cache_fill = ax.fill_between(x_range, hit_ratios, alpha=0.2, color='#e74c3c')
+            ax.autoscale_view()
             
             # Update stats
-            if hit_ratios:
+            if len(hit_ratios):
                 current = hit_ratios[-1]
-                avg = sum(hit_ratios) / len(hit_ratios)
+                avg = hit_ratios.mean()
                 self.cache_stat.setText(f"Cache Hit: {current:.1f}% (Avg: {avg:.1f}%)")
             
             self.cache_figure.tight_layout()
-            self.cache_canvas.draw()
+            self.cache_canvas.draw_idle()
         except Exception as e:
             print(f"Error updating cache graph: {str(e)}")
         
-    def update_page_faults_graph(self, perf_metrics):
+    def update_page_faults_graph(self):
         """Update page faults graph"""
         try:
-            self.page_figure.clear()
-            ax = self.page_figure.add_subplot(111)
+            ax = self.page_ax
             
-            page_faults = perf_metrics['page_faults']
-            x_range = range(len(page_faults))
+            page_faults = self._page_buf.view()
+            x_range = np.arange(len(page_faults), dtype=np.float32)
             
-            # Create bar plot with color gradient based on value
-            max_faults = max(page_faults) if page_faults else 1
-            colors = plt.cm.RdYlGn_r(np.array(page_faults) / max_faults)
-            ax.bar(x_range, page_faults, color=colors, alpha=0.7)
+            # Update bar heights with color gradient based on value
+            max_faults = (page_faults.max() if len(page_faults) else 0) or 1
+            idx = np.clip((page_faults * 255 / max_faults).astype(np.int32), 0, 255)
+            colors = self._page_cmap_lut[idx]
+            for bar, h, color in zip(self.page_bars, page_faults, colors):
+                bar.set_height(h)
+                bar.set_facecolor(color)
+            for bar in self.page_bars.patches[len(page_faults):]:
+                bar.set_height(0)
             
-            # Add trend line
+            # Update trend line
             if len(page_faults) > 1:
-                z = np.polyfit(x_range, page_faults, 1)
-                p = np.poly1d(z)
-                ax.plot(x_range, p(x_range), "r--", alpha=0.8, label='Trend')
-                ax.legend()
+                m, b = _linfit1(page_faults)
+                self.page_trend_line.set_data(x_range, m * x_range + b)
+            else:
+                self.page_trend_line.set_data([], [])
             
-            ax.set_title('Page Faults Over Time')
-            ax.set_ylabel('Page Faults')
-            ax.grid(True, axis='y', alpha=0.3)
+            ax.relim()
+            ax.autoscale_view()
             
             # Update stats
-            if page_faults:
-                current = page_faults[-1]
-                avg = sum(page_faults) / len(page_faults)
+            if len(page_faults):
+                current = int(page_faults[-1])
+                avg = page_faults.mean()
                 self.page_stat.setText(f"Page Faults: {current} (Avg: {avg:.1f})")
             
             self.page_figure.tight_layout()
-            self.page_canvas.draw()
+            self.page_canvas.draw_idle()
         except Exception as e:
             print(f"Error updating page faults graph: {str(e)}")
         
-    def update_all_graphs(self, memory_history, cpu_history, cache_history, perf_metrics, timestamps):
-        """Update all performance graphs"""
+    def update_all_graphs(self):
+        """Update all performance graphs from the samples fed via append_sample()"""
         try:
-            self.update_memory_graph(memory_history, timestamps)
-            self.update_cpu_graph(cpu_history)
-            self.update_cache_graph(cache_history)
-            self.update_page_faults_graph(perf_metrics)
+            self.update_memory_graph()
+            self.update_cpu_graph()
+            self.update_cache_graph()
+            self.update_page_faults_graph()
         except Exception as e:
             print(f"Error updating all graphs: {str(e)}") 
\ No newline at end of file
@@ -31,8 +31,10 @@ if __name__ == '__main__':
         logger.info("Application started with administrator privileges")
     
     try:
-        # Start the Flask application
-        app.run(debug=True)
+        # Start the Flask application; debug mode and its reloader are
+        # opt-in via VMEM_DEBUG=1 since they slow every request
+        debug = os.environ.get('VMEM_DEBUG') == '1'
+        app.run(debug=debug, use_reloader=debug, threaded=True)
     except Exception as e:
         logger.error(f"Error starting the application: {str(e)}")
         sys.exit(1)
@@ -0,0 +1,15 @@
+from setuptools import setup
+from setuptools.command.build_py import build_py
+
+# The repository root doubles as the `app` package, so only the web app
+# modules are packaged; tests, fixtures and the desktop scripts stay out
+APP_MODULES = {'__init__', 'camparison', 'comparison', 'models'}
+
+
+class AppModulesBuildPy(build_py):
+    def find_package_modules(self, package, package_dir):
+        modules = super().find_package_modules(package, package_dir)
+        return [m for m in modules if m[1] in APP_MODULES]
+
+
+setup(cmdclass={'build_py': AppModulesBuildPy})
@@ -4,9 +4,16 @@
 import sys
 import os
 import platform
+import functools
+import heapq
+import operator
 import time
 import logging
+import subprocess
+import gc
+import ctypes
 import psutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from PyQt5.QtWidgets import (
@@ -14,7 +21,7 @@ from PyQt5.QtWidgets import (
     QHBoxLayout, QPushButton, QLabel, QProgressBar, QGroupBox,
     QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox
 )
-from PyQt5.QtCore import QTimer, Qt
+from PyQt5.QtCore import QTimer, Qt, QEvent, pyqtSignal, QObject, QThread
 from PyQt5.QtGui import QFont
 
 # Configure logging
@@ -24,6 +31,31 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+class WorkerSignals(QObject):
+    '''Defines the signals available from a running worker thread.'''
+    finished = pyqtSignal(bool, str)
+    error = pyqtSignal(str)
+
+
+class OptimizeWorker(QThread):
+    '''Worker thread for running an optimization off the GUI thread'''
+    def __init__(self, optimize_func):
+        super().__init__()
+        self.optimize_func = optimize_func
+        self.signals = WorkerSignals()
+        
+    def run(self):
+        try:
+            success, message = self.optimize_func()
+            
+            # Emit results
+            self.signals.finished.emit(success, message)
+        except Exception as e:
+            logger.error(f"Error in optimization worker: {e}")
+            self.signals.error.emit(str(e))
+
+
 class SimpleMemoryMonitorApp(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -45,6 +77,8 @@ class SimpleMemoryMonitorApp(QMainWindow):
         self.memory_usage_label = QLabel("Memory Usage: --")
         self.memory_usage_bar = QProgressBar()
         self.memory_usage_bar.setRange(0, 100)
+        # The label above already shows the percentage, so skip bar text rendering
+        self.memory_usage_bar.setFormat("")
         
         memory_details_layout = QHBoxLayout()
         self.memory_total_label = QLabel("Total: --")
@@ -90,42 +124,158 @@ class SimpleMemoryMonitorApp(QMainWindow):
         self.status_label = QLabel("Ready")
         self.main_layout.addWidget(self.status_label)
         
-        # Setup update timer (1 second interval)
+        # Non-modal banner for optimization results; errors still use a dialog
+        self._notice = QLabel()
+        self._notice.setWordWrap(True)
+        self._notice.hide()
+        self.main_layout.addWidget(self._notice)
+        self._notice_timer = QTimer()
+        self._notice_timer.setSingleShot(True)
+        self._notice_timer.timeout.connect(self._notice.hide)
+        
+        # Setup update timer (2 second interval, coarse so the OS can coalesce wakeups)
         self.update_timer = QTimer()
+        self.update_timer.setTimerType(Qt.CoarseTimer)
         self.update_timer.timeout.connect(self.update_stats)
-        self.update_timer.start(1000)  # 1000ms = 1s
+        self.update_timer.start(2000)  # 2000ms = 2s
+        
+        # The OS cannot change at runtime, so resolve the per-OS optimizers once
+        self._system = platform.system()
+        self._mem_opt = {
+            'Windows': self.optimize_windows_memory,
+            'Linux': self.optimize_linux_memory,
+            'Darwin': self.optimize_macos_memory,  # macOS
+        }.get(self._system)
+        self._cache_opt = {
+            'Windows': self.optimize_windows_cache,
+            'Linux': self.optimize_linux_cache,
+            'Darwin': self.optimize_macos_cache,  # macOS
+        }.get(self._system)
+        
+        # On Linux, keep /proc/meminfo open and re-read it with pread each tick
+        self._meminfo_fd = None
+        if self._system == 'Linux':
+            try:
+                self._meminfo_fd = os.open('/proc/meminfo', os.O_RDONLY)
+            except OSError as e:
+                logger.error(f"Error opening /proc/meminfo: {e}")
+        
+        # Temp directories from the standard environment variables, resolved
+        # once and deduplicated since TEMP and TMP usually point to the same place
+        self._temp_paths = []
+        seen = set()
+        for var in ('TEMP', 'TMP', 'TMPDIR'):
+            path = os.environ.get(var)
+            if path and os.path.isdir(path):
+                key = os.path.normcase(os.path.abspath(path))
+                if key not in seen:
+                    seen.add(key)
+                    self._temp_paths.append(path)
+        
+        # Last rendered label values, so unchanged ticks skip the repaint
+        self._last = {'pct': None, 'used': None, 'free': None}
+        self._last_pct = -1
+        
+        # Total memory never changes at runtime, so render it once
+        try:
+            _, total, _, _ = self.get_memory_usage()
+            self.memory_total_label.setText(f"Total: {total / (1024**3):.1f} GB")
+        except Exception as e:
+            logger.error(f"Error reading total memory: {e}")
         
         # Initial update
         self.update_stats()
     
-    def is_admin(self):
-        """Check if the application is running with admin privileges"""
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def is_admin():
+        """Check if the application is running with admin privileges
+
+        Admin status cannot change during the process lifetime, so the
+        result is cached after the first call.
+        """
         try:
             if platform.system() == 'Windows':
-                import ctypes
                 return ctypes.windll.shell32.IsUserAnAdmin() != 0
             else:
                 return os.geteuid() == 0
         except:
             return False
     
+    def hideEvent(self, event):
+        # Nothing is visible, so stop polling until the window is shown again
+        self.update_timer.stop()
+        super().hideEvent(event)
+    
+    def showEvent(self, event):
+        if not self.update_timer.isActive():
+            self.update_timer.start()
+            self.update_stats()
+        super().showEvent(event)
+    
+    def changeEvent(self, event):
+        if event.type() == QEvent.WindowStateChange:
+            if self.windowState() & Qt.WindowMinimized:
+                self.update_timer.stop()
+            elif not self.update_timer.isActive():
+                self.update_timer.start()
+                self.update_stats()
+        super().changeEvent(event)
+    
+    def _read_meminfo(self):
+        """Return (percent, total, used, available) in bytes from /proc/meminfo"""
+        fields = {}
+        for line in os.pread(self._meminfo_fd, 8192, 0).splitlines():
+            key, _, value = line.partition(b':')
+            fields[key] = int(value.split()[0]) * 1024
+        
+        total = fields[b'MemTotal']
+        available = fields[b'MemAvailable']
+        # Same definitions psutil uses on Linux
+        used = total - fields[b'MemFree'] - fields[b'Buffers'] - fields[b'Cached'] - fields.get(b'SReclaimable', 0)
+        if used < 0:
+            used = total - fields[b'MemFree']
+        percent = (total - available) / total * 100
+        return percent, total, used, available
+    
+    def get_memory_usage(self):
+        """Return (percent, total, used, available) memory figures in bytes"""
+        if self._meminfo_fd is not None:
+            try:
+                return self._read_meminfo()
+            except (OSError, KeyError, ValueError, IndexError) as e:
+                logger.error(f"Error reading /proc/meminfo, falling back to psutil: {e}")
+                os.close(self._meminfo_fd)
+                self._meminfo_fd = None
+        
+        mem = psutil.virtual_memory()
+        return mem.percent, mem.total, mem.used, mem.available
+    
     def update_stats(self):
         try:
-            mem = psutil.virtual_memory()
+            percent, total, used, available = self.get_memory_usage()
             
             # Update memory stats
-            memory_percent = mem.percent
-            self.memory_usage_label.setText(f"Memory Usage: {memory_percent:.1f}%")
-            self.memory_usage_bar.setValue(int(memory_percent))
+            pct_text = f"Memory Usage: {percent:.1f}%"
+            if pct_text != self._last['pct']:
+                self.memory_usage_label.setText(pct_text)
+                self._last['pct'] = pct_text
             
-            # Update memory details
-            total_gb = mem.total / (1024**3)
-            used_gb = mem.used / (1024**3)
-            free_gb = mem.available / (1024**3)
+            # The bar only moves in whole percents, so repaint it only then
+            pct = int(percent)
+            if pct != self._last_pct:
+                self.memory_usage_bar.setValue(pct)
+                self._last_pct = pct
             
-            self.memory_total_label.setText(f"Total: {total_gb:.1f} GB")
-            self.memory_used_label.setText(f"Used: {used_gb:.1f} GB")
-            self.memory_free_label.setText(f"Free: {free_gb:.1f} GB")
+            # Update memory details, formatting only when the shown tenth of a GB changes
+            for key, label, prefix, value in (
+                ('used', self.memory_used_label, "Used", used),
+                ('free', self.memory_free_label, "Free", available),
+            ):
+                tenths = round(value / (1024**3) * 10)
+                if tenths != self._last[key]:
+                    label.setText(f"{prefix}: {tenths / 10:.1f} GB")
+                    self._last[key] = tenths
             
         except Exception as e:
             logger.error(f"Error updating stats: {e}")
@@ -136,51 +286,68 @@ class SimpleMemoryMonitorApp(QMainWindow):
         self.memory_optimize_btn.setText("Optimizing...")
         self.status_label.setText("Optimizing memory...")
         
-        # Run optimization in the main thread (for simplicity)
-        try:
-            success, message = self.perform_memory_optimization()
-            
-            if success:
-                self.status_label.setText("Memory optimization completed successfully")
-                QMessageBox.information(self, "Optimization Complete", f"Memory optimization completed successfully.\n\n{message}")
-            else:
-                self.status_label.setText("Memory optimization completed with issues")
-                QMessageBox.warning(self, "Optimization Warning", f"Memory optimization completed with issues.\n\n{message}")
-            
-        except Exception as e:
-            logger.error(f"Error in memory optimization: {e}")
-            self.status_label.setText(f"Error: {str(e)}")
-            QMessageBox.critical(self, "Optimization Error", f"Error during optimization: {str(e)}")
+        # Run the optimization in a worker thread so the UI stays responsive
+        self.memory_worker = OptimizeWorker(self.perform_memory_optimization)
+        self.memory_worker.signals.finished.connect(self.on_memory_optimization_finished)
+        self.memory_worker.signals.error.connect(self.on_memory_optimization_error)
+        self.memory_worker.start()
+    
+    def show_notice(self, text, color="green"):
+        """Show a self-dismissing result banner without blocking the event loop"""
+        self._notice.setStyleSheet(f"color: {color};")
+        self._notice.setText(text)
+        self._notice.show()
+        # Restarting the timer keeps a newer notice from being hidden early
+        self._notice_timer.start(3000)
+    
+    def on_memory_optimization_finished(self, success, message):
+        self.memory_optimize_btn.setEnabled(True)
+        self.memory_optimize_btn.setText("Optimize Memory")
         
+        if success:
+            self.status_label.setText("Memory optimization completed successfully")
+            self.show_notice(f"Memory optimization completed successfully. {message}")
+        else:
+            self.status_label.setText("Memory optimization completed with issues")
+            self.show_notice(f"Memory optimization completed with issues. {message}", color="orange")
+        
+        # The update timer picks up the post-optimization figures on its next tick
+    
+    def on_memory_optimization_error(self, error_message):
         self.memory_optimize_btn.setEnabled(True)
         self.memory_optimize_btn.setText("Optimize Memory")
         
-        # Update stats after optimization
-        self.update_stats()
+        self.status_label.setText(f"Error: {error_message}")
+        QMessageBox.critical(self, "Optimization Error", f"Error during optimization: {error_message}")
     
     def optimize_cache(self):
         self.cache_optimize_btn.setEnabled(False)
         self.cache_optimize_btn.setText("Optimizing...")
         self.status_label.setText("Optimizing cache...")
         
-        # Run optimization in the main thread (for simplicity)
-        try:
-            success, message = self.perform_cache_optimization()
-            
-            if success:
-                self.status_label.setText("Cache optimization completed successfully")
-                QMessageBox.information(self, "Optimization Complete", f"Cache optimization completed successfully.\n\n{message}")
-            else:
-                self.status_label.setText("Cache optimization completed with issues")
-                QMessageBox.warning(self, "Optimization Warning", f"Cache optimization completed with issues.\n\n{message}")
-            
-        except Exception as e:
-            logger.error(f"Error in cache optimization: {e}")
-            self.status_label.setText(f"Error: {str(e)}")
-            QMessageBox.critical(self, "Optimization Error", f"Error during optimization: {str(e)}")
+        # Run the optimization in a worker thread so the UI stays responsive
+        self.cache_worker = OptimizeWorker(self.perform_cache_optimization)
+        self.cache_worker.signals.finished.connect(self.on_cache_optimization_finished)
+        self.cache_worker.signals.error.connect(self.on_cache_optimization_error)
+        self.cache_worker.start()
+    
+    def on_cache_optimization_finished(self, success, message):
+        self.cache_optimize_btn.setEnabled(True)
+        self.cache_optimize_btn.setText("Optimize Cache")
         
+        if success:
+            self.status_label.setText("Cache optimization completed successfully")
+            self.show_notice(f"Cache optimization completed successfully. {message}")
+        else:
+            self.status_label.setText("Cache optimization completed with issues")
+            self.show_notice(f"Cache optimization completed with issues. {message}", color="orange")
+    
+    def on_cache_optimization_error(self, error_message):
         self.cache_optimize_btn.setEnabled(True)
         self.cache_optimize_btn.setText("Optimize Cache")
+        
+        self.status_label.setText(f"Error: {error_message}")
+        QMessageBox.critical(self, "Optimization Error", f"Error during optimization: {error_message}")
     
     def perform_memory_optimization(self):
         """Perform memory optimization based on the current OS"""
@@ -188,15 +355,9 @@ class SimpleMemoryMonitorApp(QMainWindow):
             logger.warning("Memory optimization requires administrator privileges")
             return self.perform_user_level_memory_optimization()
         
-        system = platform.system()
-        if system == 'Windows':
-            return self.optimize_windows_memory()
-        elif system == 'Linux':
-            return self.optimize_linux_memory()
-        elif system == 'Darwin':  # macOS
-            return self.optimize_macos_memory()
-        else:
-            return False, f"Unsupported operating system: {system}"
+        if self._mem_opt is None:
+            return False, f"Unsupported operating system: {self._system}"
+        return self._mem_opt()
     
     def perform_user_level_memory_optimization(self):
         """Perform memory optimizations that don't require admin privileges"""
@@ -204,23 +365,14 @@ class SimpleMemoryMonitorApp(QMainWindow):
         message = ""
         
         # Force Python garbage collection
-        import gc
         gc.collect()
         message += "Garbage collection performed. "
         success = True
         
         # Clear any temp files we have access to
         try:
-            # Get user temp directory
-            temp_paths = []
-            
-            # Try standard temp environment variables
-            for var in ['TEMP', 'TMP', 'TMPDIR']:
-                if var in os.environ and os.path.exists(os.environ[var]):
-                    temp_paths.append(os.environ[var])
-            
             # Clear files in accessible temp directories
-            for temp_path in temp_paths:
+            for temp_path in self._temp_paths:
                 cleared = self.safely_clear_temp_directory(temp_path)
                 if cleared > 0:
                     success = True
@@ -235,6 +387,16 @@ class SimpleMemoryMonitorApp(QMainWindow):
         else:
             return False, "User-level memory optimization failed"
     
+    @staticmethod
+    def _try_unlink(file_path):
+        """Delete a file, returning 1 on success and 0 if it could not be removed"""
+        try:
+            os.unlink(file_path)
+            return 1
+        except OSError:
+            # Skip files we can't delete
+            return 0
+    
     def safely_clear_temp_directory(self, directory, max_files=50):
         """Safely clear temporary files in a directory"""
         if not os.path.exists(directory) or not os.path.isdir(directory):
@@ -242,28 +404,24 @@ class SimpleMemoryMonitorApp(QMainWindow):
         
         count = 0
         try:
-            # Get list of files sorted by modification time (oldest first)
+            # Get list of files with their modification times; DirEntry
+            # caches the type and stat info from the directory scan
             files = []
-            for item in os.listdir(directory):
-                item_path = os.path.join(directory, item)
-                if os.path.isfile(item_path):
+            with os.scandir(directory) as entries:
+                for entry in entries:
                     try:
-                        mtime = os.path.getmtime(item_path)
-                        files.append((item_path, mtime))
-                    except:
+                        if entry.is_file(follow_symlinks=False):
+                            files.append((entry.path, entry.stat(follow_symlinks=False).st_mtime))
+                    except OSError:
                         pass
             
-            # Sort files by modification time (oldest first)
-            files.sort(key=lambda x: x[1])
-            
-            # Delete oldest files first, up to max_files
-            for file_path, _ in files[:max_files]:
-                try:
-                    os.unlink(file_path)
-                    count += 1
-                except:
-                    # Skip files we can't delete
-                    pass
+            # Delete oldest files first, up to max_files; a bounded heap avoids
+            # sorting the whole listing when only the oldest few are needed
+            oldest = heapq.nsmallest(max_files, files, key=operator.itemgetter(1))
+            if oldest:
+                # Unlink calls release the GIL, so overlapping them hides I/O latency
+                with ThreadPoolExecutor(max_workers=min(8, len(oldest))) as executor:
+                    count = sum(executor.map(self._try_unlink, (path for path, _ in oldest)))
             
         except Exception as e:
             logger.error(f"Error clearing temp directory {directory}: {str(e)}")
@@ -277,9 +435,7 @@ class SimpleMemoryMonitorApp(QMainWindow):
         
         # 1. Clear standby list and working sets
         try:
-            import subprocess
-            subprocess.run("powershell -Command \"& {Get-Process | ForEach-Object { [void][System.Runtime.InteropServices.Marshal]::SetProcessWorkingSetSize($_.Handle, -1, -1) }}\"", 
-                          shell=True, check=False)
+            self.trim_process_working_sets()
             success = True
             message += "Process working sets cleared. "
         except Exception as e:
@@ -288,9 +444,11 @@ class SimpleMemoryMonitorApp(QMainWindow):
         
         # 2. Clear DNS cache
         try:
-            subprocess.run("ipconfig /flushdns", shell=True, check=False)
-            success = True
-            message += "DNS cache cleared. "
+            if self.flush_dns_cache():
+                success = True
+                message += "DNS cache cleared. "
+            else:
+                message += "DNS cache clearing failed. "
         except Exception as e:
             logger.error(f"Failed to clear DNS cache: {str(e)}")
             message += "DNS cache clearing failed. "
@@ -315,6 +473,38 @@ class SimpleMemoryMonitorApp(QMainWindow):
         else:
             return False, f"Windows memory optimization failed: {message}"
     
+    def flush_dns_cache(self):
+        """Flush the Windows DNS resolver cache in-process, returning True on success"""
+        # Same operation as 'ipconfig /flushdns' without starting a child process
+        dnsapi = ctypes.WinDLL('dnsapi')
+        return bool(dnsapi.DnsFlushResolverCache())
+    
+    def trim_process_working_sets(self):
+        """Trim the working set of every process we can open, returning how many were trimmed"""
+        PROCESS_SET_QUOTA = 0x0100
+        PROCESS_QUERY_INFORMATION = 0x0400
+        
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        kernel32.OpenProcess.argtypes = [ctypes.c_uint32, ctypes.c_int, ctypes.c_uint32]
+        kernel32.OpenProcess.restype = ctypes.c_void_p
+        kernel32.SetProcessWorkingSetSize.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_size_t]
+        kernel32.CloseHandle.argtypes = [ctypes.c_void_p]
+        
+        # (SIZE_T)-1 for both limits asks Windows to empty the working set
+        trim_size = ctypes.c_size_t(-1)
+        trimmed = 0
+        for pid in psutil.pids():
+            handle = kernel32.OpenProcess(PROCESS_SET_QUOTA | PROCESS_QUERY_INFORMATION, False, pid)
+            if not handle:
+                # Protected or already exited
+                continue
+            try:
+                if kernel32.SetProcessWorkingSetSize(handle, trim_size, trim_size):
+                    trimmed += 1
+            finally:
+                kernel32.CloseHandle(handle)
+        return trimmed
+    
     def optimize_linux_memory(self):
         """Optimize memory on Linux systems"""
         success = False
@@ -322,7 +512,9 @@ class SimpleMemoryMonitorApp(QMainWindow):
         
         # 1. Drop caches
         try:
-            os.system("sync && echo 3 > /proc/sys/vm/drop_caches")
+            os.sync()
+            with open('/proc/sys/vm/drop_caches', 'wb') as f:
+                f.write(b'3')
             success = True
             message += "File system caches dropped. "
         except Exception as e:
@@ -342,7 +534,7 @@ class SimpleMemoryMonitorApp(QMainWindow):
         
         # 1. Purge memory
         try:
-            os.system("purge")
+            subprocess.run(['purge'], check=False)
             success = True
             message += "Memory purged. "
         except Exception as e:
@@ -361,15 +553,9 @@ class SimpleMemoryMonitorApp(QMainWindow):
             logger.warning("Limited cache optimization - No administrator privileges")
             return self.perform_user_level_cache_optimization()
         
-        system = platform.system()
-        if system == 'Windows':
-            return self.optimize_windows_cache()
-        elif system == 'Linux':
-            return self.optimize_linux_cache()
-        elif system == 'Darwin':  # macOS
-            return self.optimize_macos_cache()
-        else:
-            return False, f"Unsupported operating system: {system}"
+        if self._cache_opt is None:
+            return False, f"Unsupported operating system: {self._system}"
+        return self._cache_opt()
     
     def perform_user_level_cache_optimization(self):
         """Perform cache optimizations that don't require admin privileges"""
@@ -379,18 +565,15 @@ class SimpleMemoryMonitorApp(QMainWindow):
         # Try to free memory which can help cache performance
         try:
             # Force Python garbage collection
-            import gc
             gc.collect()
             
-            # Use psutil to close handle to unused memory
-            for proc in psutil.process_iter(['pid', 'name', 'username']):
-                if proc.info['pid'] == os.getpid():
-                    # This is our own process, we can safely trim its memory
-                    try:
-                        # On Windows, this calls SetProcessWorkingSetSize
-                        proc.memory_info()
-                    except:
-                        pass
+            # Trim our own working set, which needs no extra privileges
+            if self._system == 'Windows':
+                kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+                kernel32.GetCurrentProcess.restype = ctypes.c_void_p
+                kernel32.SetProcessWorkingSetSize.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_size_t]
+                trim_size = ctypes.c_size_t(-1)
+                kernel32.SetProcessWorkingSetSize(kernel32.GetCurrentProcess(), trim_size, trim_size)
             
             success = True
             message += "Memory freed at user-level. "
@@ -410,10 +593,11 @@ class SimpleMemoryMonitorApp(QMainWindow):
         
         # Clear DNS cache - may work without admin rights on some Windows versions
         try:
-            import subprocess
-            subprocess.run("ipconfig /flushdns", shell=True, check=False)
-            success = True
-            message += "DNS cache cleared. "
+            if self.flush_dns_cache():
+                success = True
+                message += "DNS cache cleared. "
+            else:
+                message += "DNS cache clearing failed. "
         except Exception as e:
             logger.error(f"Failed to clear DNS cache: {str(e)}")
             message += "DNS cache clearing failed. "
@@ -428,9 +612,7 @@ class SimpleMemoryMonitorApp(QMainWindow):
         
         # Clear system working set
         try:
-            # This PowerShell command attempts to trim working sets of processes
-            subprocess.run("powershell -Command \"Get-Process | ForEach-Object { [void][System.Runtime.InteropServices.Marshal]::SetProcessWorkingSetSize($_.Handle, -1, -1) }\"", 
-                          shell=True, check=False)
+            self.trim_process_working_sets()
             success = True
             message += "Process working sets cleared. "
         except Exception as e:
@@ -450,7 +632,9 @@ class SimpleMemoryMonitorApp(QMainWindow):
         
         # Balance file system caches - drops clean caches but keeps active ones
         try:
-            os.system("sync && echo 1 > /proc/sys/vm/drop_caches")
+            os.sync()
+            with open('/proc/sys/vm/drop_caches', 'wb') as f:
+                f.write(b'1')
             success = True
             message += "File system caches balanced. "
         except Exception as e:
@@ -469,8 +653,9 @@ class SimpleMemoryMonitorApp(QMainWindow):
         
         # Clear DNS cache
         try:
-            os.system("dscacheutil -flushcache")
-            os.system("killall -HUP mDNSResponder")
+            # Run both directly rather than through /bin/sh
+            subprocess.run(['dscacheutil', '-flushcache'], check=False)
+            subprocess.run(['killall', '-HUP', 'mDNSResponder'], check=False)
             success = True
             message += "DNS cache cleared. "
         except Exception as e:
@@ -4,61 +4,63 @@
 import sys
 import os
 import platform
+import functools
 import time
 import logging
+import faulthandler
 import subprocess
+import heapq
+from operator import itemgetter
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import psutil
-import numpy as np
 from datetime import datetime
-from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QTabWidget, QWidget, QVBoxLayout, 
-    QHBoxLayout, QPushButton, QLabel, QProgressBar, QGridLayout,
-    QMessageBox, QGroupBox
-)
-from PyQt5.QtCore import QTimer, Qt, pyqtSignal, QObject, QThread
-from PyQt5.QtGui import QFont, QColor
 
-# Configure logging
+# Configure logging; only warnings and errors are emitted unless
+# VMEM_DEBUG=1 is set, which keeps record formatting off the hot paths
 logging.basicConfig(
-    level=logging.INFO,
+    level=logging.DEBUG if os.environ.get('VMEM_DEBUG') == '1' else logging.WARNING,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
-
-class WorkerSignals(QObject):
-    '''Defines the signals available from a running worker thread.'''
-    finished = pyqtSignal(bool, str)
-    error = pyqtSignal(str)
-
-
-class OptimizeWorker(QThread):
-    '''Worker thread for running optimization tasks'''
-    def __init__(self, optimize_type):
-        super().__init__()
-        self.optimize_type = optimize_type
-        self.signals = WorkerSignals()
-        
-    def run(self):
-        try:
-            if self.optimize_type == 'memory':
-                success, message = optimize_memory()
-            elif self.optimize_type == 'cache':
-                success, message = optimize_cache()
-            else:
-                raise ValueError(f"Unknown optimization type: {self.optimize_type}")
-                
-            # Emit results
-            self.signals.finished.emit(success, message)
-        except Exception as e:
-            logger.error(f"Error in optimization worker: {e}")
-            self.signals.error.emit(str(e))
-
-
+# The OS cannot change at runtime, so resolve it once at import
+_SYSTEM = platform.system()
+
+# Worker threads used to overlap file deletions
+_DELETE_WORKERS = 8
+
+# Upper bound in seconds for each system command, so a hung purge cannot stall a worker
+_COMMAND_TIMEOUT = 15
+
+# Browser cache locations for this OS, built once at import: (base directory,
+# glob pattern for per-profile caches or None to clear the base itself)
+_HOME = Path.home()
+_BROWSER_CACHE_TARGETS = {
+    'Windows': (
+        (_HOME / 'AppData' / 'Local' / 'Google' / 'Chrome' / 'User Data' / 'Default' / 'Cache', None),
+        (_HOME / 'AppData' / 'Local' / 'Mozilla' / 'Firefox' / 'Profiles', '*/cache2'),
+    ),
+    'Linux': (
+        (_HOME / '.cache' / 'google-chrome' / 'Default' / 'Cache', None),
+        (_HOME / '.mozilla' / 'firefox', '*.default/cache2'),
+    ),
+    'Darwin': (
+        (_HOME / 'Library' / 'Caches' / 'Google' / 'Chrome' / 'Default' / 'Cache', None),
+        (_HOME / 'Library' / 'Caches' / 'Firefox', None),
+    ),
+}.get(_SYSTEM, ())
+
+
+@functools.lru_cache(maxsize=1)
 def is_admin():
-    """Check if the application is running with admin privileges"""
+    """Check if the application is running with admin privileges
+
+    Privileges cannot change while the process runs, so the result is
+    cached; call is_admin.cache_clear() to force a fresh check.
+    """
     try:
-        if platform.system() == 'Windows':
+        if _SYSTEM == 'Windows':
             import ctypes
             return ctypes.windll.shell32.IsUserAnAdmin() != 0
         else:
@@ -68,41 +70,68 @@ def is_admin():
         return False
 
 
-def run_command(cmd, shell=True):
-    """Run a system command and return the output"""
+def run_command_fast(cmd):
+    """Run a system command whose output is not needed and return whether it succeeded"""
     try:
+        # Output is discarded rather than piped and decoded
         result = subprocess.run(
-            cmd, 
-            shell=shell, 
-            check=True, 
-            stdout=subprocess.PIPE, 
-            stderr=subprocess.PIPE,
-            text=True
+            cmd,
+            shell=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=_COMMAND_TIMEOUT
         )
-        return True, result.stdout
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Command failed: {e.stderr}")
-        return False, e.stderr
+        return result.returncode == 0, ""
+    except subprocess.TimeoutExpired:
+        logger.error(f"Command timed out: {cmd}")
+        return False, "timed out"
     except Exception as e:
         logger.error(f"Error running command: {str(e)}")
         return False, str(e)
 
 
+def run_command_batch(commands):
+    """Run several shell commands in a single shell invocation and return a success flag for each"""
+    if _SYSTEM == 'Windows':
+        template, separator = '({cmd}) >nul 2>&1 && echo __OK_{i}__', ' & '
+    else:
+        template, separator = '{{ {cmd}; }} >/dev/null 2>&1 && echo __OK_{i}__', '; '
+    script = separator.join(template.format(cmd=cmd, i=i) for i, cmd in enumerate(commands))
+    try:
+        # Each command reports its own result through a marker line, so the
+        # shell's overall exit code is not meaningful here
+        result = subprocess.run(
+            script,
+            shell=True,
+            check=False,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            # Give every step its own budget rather than one for the whole batch
+            timeout=_COMMAND_TIMEOUT * len(commands)
+        )
+        output = result.stdout.split()
+        return [f"__OK_{i}__" in output for i in range(len(commands))]
+    except subprocess.TimeoutExpired as e:
+        # Steps that finished before the timeout still printed their markers
+        logger.error(f"Command batch timed out: {commands}")
+        partial = e.stdout or ''
+        if isinstance(partial, bytes):
+            partial = partial.decode(errors='ignore')
+        output = partial.split()
+        return [f"__OK_{i}__" in output for i in range(len(commands))]
+    except Exception as e:
+        logger.error(f"Error running command batch: {str(e)}")
+        return [False] * len(commands)
+
+
 def optimize_memory():
     """Perform memory optimization based on the current OS"""
     if not is_admin():
         logger.warning("Memory optimization requires administrator privileges")
         return perform_user_level_memory_optimization()
     
-    system = platform.system()
-    if system == 'Windows':
-        return optimize_windows_memory()
-    elif system == 'Linux':
-        return optimize_linux_memory()
-    elif system == 'Darwin':  # macOS
-        return optimize_macos_memory()
-    else:
-        return False, f"Unsupported operating system: {system}"
+    return _MEM_DISPATCH.get(_SYSTEM, _unsupported_system)()
 
 
 def perform_user_level_memory_optimization():
@@ -121,10 +150,16 @@ def perform_user_level_memory_optimization():
         # Get user temp directory
         temp_paths = []
         
-        # Try standard temp environment variables
-        for var in ['TEMP', 'TMP', 'TMPDIR']:
-            if var in os.environ and os.path.exists(os.environ[var]):
-                temp_paths.append(os.environ[var])
+        # Try standard temp environment variables; TEMP and TMP often name
+        # the same directory, so resolve and dedupe to avoid clearing it twice
+        seen = set()
+        for var in ('TEMP', 'TMP', 'TMPDIR'):
+            path = os.environ.get(var)
+            if path and os.path.isdir(path):
+                key = os.path.normcase(os.path.abspath(path))
+                if key not in seen:
+                    seen.add(key)
+                    temp_paths.append(path)
         
         # Clear files in accessible temp directories
         for temp_path in temp_paths:
@@ -143,6 +178,27 @@ def perform_user_level_memory_optimization():
         return False, "User-level memory optimization failed"
 
 
+def _try_unlink(file_path):
+    """Delete a file, returning 1 on success and 0 if it could not be removed"""
+    try:
+        os.unlink(file_path)
+        return 1
+    except OSError:
+        # Skip files we can't delete
+        return 0
+
+
+def _iter_file_mtimes(entries):
+    """Yield (path, mtime) for the regular files among scandir entries"""
+    # DirEntry caches the type and stat info from the directory scan
+    for entry in entries:
+        try:
+            if entry.is_file(follow_symlinks=False):
+                yield entry.path, entry.stat(follow_symlinks=False).st_mtime
+        except OSError:
+            pass
+
+
 def safely_clear_temp_directory(directory, max_files=50):
     """Safely clear temporary files in a directory"""
     if not os.path.exists(directory) or not os.path.isdir(directory):
@@ -150,28 +206,14 @@ def safely_clear_temp_directory(directory, max_files=50):
     
     count = 0
     try:
-        # Get list of files sorted by modification time (oldest first)
-        files = []
-        for item in os.listdir(directory):
-            item_path = os.path.join(directory, item)
-            if os.path.isfile(item_path):
-                try:
-                    mtime = os.path.getmtime(item_path)
-                    files.append((item_path, mtime))
-                except:
-                    pass
-        
-        # Sort files by modification time (oldest first)
-        files.sort(key=lambda x: x[1])
-        
-        # Delete oldest files first, up to max_files
-        for file_path, _ in files[:max_files]:
-            try:
-                os.unlink(file_path)
-                count += 1
-            except:
-                # Skip files we can't delete
-                pass
+        # Delete oldest files first, up to max_files; streaming the scan into
+        # a bounded heap avoids building and sorting the whole listing
+        with os.scandir(directory) as entries:
+            oldest = heapq.nsmallest(max_files, _iter_file_mtimes(entries), key=itemgetter(1))
+        if oldest:
+            # Unlink calls release the GIL, so overlapping them hides I/O latency
+            with ThreadPoolExecutor(max_workers=min(_DELETE_WORKERS, len(oldest))) as executor:
+                count = sum(executor.map(_try_unlink, (path for path, _ in oldest)))
         
     except Exception as e:
         logger.error(f"Error clearing temp directory {directory}: {str(e)}")
@@ -184,22 +226,23 @@ def optimize_windows_memory():
     success = False
     message = ""
     
-    # 1. Clear standby list and working sets
-    try:
-        run_command("powershell -Command \"& {Get-Process | ForEach-Object { [void][System.Runtime.InteropServices.Marshal]::SetProcessWorkingSetSize($_.Handle, -1, -1) }}\"")
+    # 1. Clear standby list and working sets, and 2. clear DNS cache, in one shell
+    working_sets_ok, dns_ok = run_command_batch([
+        "powershell -Command \"& {Get-Process | ForEach-Object { [void][System.Runtime.InteropServices.Marshal]::SetProcessWorkingSetSize($_.Handle, -1, -1) }}\"",
+        "ipconfig /flushdns",
+    ])
+    if working_sets_ok:
         success = True
         message += "Process working sets cleared. "
-    except Exception as e:
-        logger.error(f"Failed to clear process working sets: {str(e)}")
+    else:
+        logger.error("Failed to clear process working sets")
         message += "Working set clearing failed. "
     
-    # 2. Clear DNS cache
-    try:
-        run_command("ipconfig /flushdns")
+    if dns_ok:
         success = True
         message += "DNS cache cleared. "
-    except Exception as e:
-        logger.error(f"Failed to clear DNS cache: {str(e)}")
+    else:
+        logger.error("Failed to clear DNS cache")
         message += "DNS cache clearing failed. "
     
     # 3. Clear Windows temp files
@@ -228,31 +271,32 @@ def optimize_linux_memory():
     success = False
     message = ""
     
-    # 1. Drop caches
-    try:
-        run_command("sync && echo 3 > /proc/sys/vm/drop_caches")
+    # 1. Drop caches, 2. compact memory and 3. adjust swappiness (reduce
+    # swapping frequency), all in one shell
+    dropped, compacted, swappiness_set = run_command_batch([
+        "sync && echo 3 > /proc/sys/vm/drop_caches",
+        "echo 1 > /proc/sys/vm/compact_memory",
+        "sysctl -w vm.swappiness=10",
+    ])
+    if dropped:
         success = True
         message += "File system caches dropped. "
-    except Exception as e:
-        logger.error(f"Failed to drop caches: {str(e)}")
+    else:
+        logger.error("Failed to drop caches")
         message += "Cache dropping failed. "
     
-    # 2. Compact memory
-    try:
-        run_command("echo 1 > /proc/sys/vm/compact_memory")
+    if compacted:
         success = True
         message += "Memory compacted. "
-    except Exception as e:
-        logger.error(f"Failed to compact memory: {str(e)}")
+    else:
+        logger.error("Failed to compact memory")
         message += "Memory compaction failed. "
     
-    # 3. Adjust swappiness (reduce swapping frequency)
-    try:
-        run_command("sysctl -w vm.swappiness=10")
+    if swappiness_set:
         success = True
         message += "Swappiness adjusted. "
-    except Exception as e:
-        logger.error(f"Failed to adjust swappiness: {str(e)}")
+    else:
+        logger.error("Failed to adjust swappiness")
         message += "Swappiness adjustment failed. "
     
     # Even if some operations fail, if we did anything successful, report success
@@ -267,23 +311,24 @@ def optimize_macos_memory():
     success = False
     message = ""
     
-    # 1. Purge memory
-    try:
-        run_command("purge")
+    # 1. Purge memory and 2. clear DNS cache, in one shell
+    purged, cache_flushed, responder_restarted = run_command_batch([
+        "purge",
+        "dscacheutil -flushcache",
+        "killall -HUP mDNSResponder",
+    ])
+    if purged:
         success = True
         message += "Memory purged. "
-    except Exception as e:
-        logger.error(f"Failed to purge memory: {str(e)}")
+    else:
+        logger.error("Failed to purge memory")
         message += "Memory purge failed. "
     
-    # 2. Clear DNS cache
-    try:
-        run_command("dscacheutil -flushcache")
-        run_command("killall -HUP mDNSResponder")
+    if cache_flushed and responder_restarted:
         success = True
         message += "DNS cache cleared. "
-    except Exception as e:
-        logger.error(f"Failed to clear DNS cache: {str(e)}")
+    else:
+        logger.error("Failed to clear DNS cache")
         message += "DNS cache clearing failed. "
     
     # Even if some operations fail, if we did anything successful, report success
@@ -299,15 +344,7 @@ def optimize_cache():
         logger.warning("Limited cache optimization - No administrator privileges")
         return perform_user_level_cache_optimization()
     
-    system = platform.system()
-    if system == 'Windows':
-        return optimize_windows_cache()
-    elif system == 'Linux':
-        return optimize_linux_cache()
-    elif system == 'Darwin':  # macOS
-        return optimize_macos_cache()
-    else:
-        return False, f"Unsupported operating system: {system}"
+    return _CACHE_DISPATCH.get(_SYSTEM, _unsupported_system)()
 
 
 def perform_user_level_cache_optimization():
@@ -331,15 +368,11 @@ def perform_user_level_cache_optimization():
         import gc
         gc.collect()
         
-        # Use psutil to close handle to unused memory
-        for proc in psutil.process_iter(['pid', 'name', 'username']):
-            if proc.info['pid'] == os.getpid():
-                # This is our own process, we can safely trim its memory
-                try:
-                    # On Windows, this calls SetProcessWorkingSetSize
-                    proc.memory_info()
-                except:
-                    pass
+        # Query our own process directly rather than scanning every process for it
+        try:
+            psutil.Process(os.getpid()).memory_info()
+        except psutil.Error:
+            pass
         
         success = True
         message += "Memory freed at user-level. "
@@ -357,48 +390,14 @@ def clear_browser_caches():
     """Try to clear browser caches"""
     cleared_any = False
     try:
-        system = platform.system()
-        home = os.path.expanduser("~")
-        
-        if system == 'Windows':
-            # Chrome cache
-            chrome_cache = os.path.join(home, 'AppData', 'Local', 'Google', 'Chrome', 'User Data', 'Default', 'Cache')
-            if safely_clear_directory(chrome_cache) > 0:
-                cleared_any = True
-            
-            # Firefox cache
-            firefox_profile = os.path.join(home, 'AppData', 'Local', 'Mozilla', 'Firefox', 'Profiles')
-            if os.path.exists(firefox_profile):
-                for profile in os.listdir(firefox_profile):
-                    cache_path = os.path.join(firefox_profile, profile, 'cache2')
-                    if safely_clear_directory(cache_path) > 0:
-                        cleared_any = True
-        
-        elif system == 'Linux':
-            # Chrome cache
-            chrome_cache = os.path.join(home, '.cache', 'google-chrome', 'Default', 'Cache')
-            if safely_clear_directory(chrome_cache) > 0:
-                cleared_any = True
-            
-            # Firefox cache
-            firefox_dir = os.path.join(home, '.mozilla', 'firefox')
-            if os.path.exists(firefox_dir):
-                for item in os.listdir(firefox_dir):
-                    if item.endswith('.default'):
-                        cache_path = os.path.join(firefox_dir, item, 'cache2')
-                        if safely_clear_directory(cache_path) > 0:
-                            cleared_any = True
-        
-        elif system == 'Darwin':  # macOS
-            # Chrome cache
-            chrome_cache = os.path.join(home, 'Library', 'Caches', 'Google', 'Chrome', 'Default', 'Cache')
-            if safely_clear_directory(chrome_cache) > 0:
-                cleared_any = True
-            
-            # Firefox cache
-            firefox_dir = os.path.join(home, 'Library', 'Caches', 'Firefox')
-            if safely_clear_directory(firefox_dir) > 0:
-                cleared_any = True
+        for base, pattern in _BROWSER_CACHE_TARGETS:
+            if not base.is_dir():
+                continue
+            # Firefox keeps one cache directory per profile, found by pattern
+            cache_paths = base.glob(pattern) if pattern else (base,)
+            for cache_path in cache_paths:
+                if safely_clear_directory(str(cache_path)) > 0:
+                    cleared_any = True
         
     except Exception as e:
         logger.error(f"Error clearing browser caches: {str(e)}")
@@ -406,6 +405,45 @@ def clear_browser_caches():
     return cleared_any
 
 
+def _fast_rmtree(path):
+    """Remove a directory tree bottom-up, skipping anything that can't be deleted"""
+    # Never descend through a link; removing the link itself leaves its target alone
+    if os.path.islink(path):
+        os.unlink(path)
+        return
+    for root, dirs, files in os.walk(path, topdown=False):
+        for name in files:
+            try:
+                os.unlink(os.path.join(root, name))
+            except OSError:
+                pass
+        for name in dirs:
+            # os.walk lists links to directories here without following them
+            dir_path = os.path.join(root, name)
+            try:
+                if os.path.islink(dir_path):
+                    os.unlink(dir_path)
+                else:
+                    os.rmdir(dir_path)
+            except OSError:
+                pass
+    os.rmdir(path)
+
+
+def _remove_entry(item):
+    """Remove a (path, is_dir) directory entry, returning 1 on success and 0 on failure"""
+    item_path, is_dir = item
+    try:
+        if not is_dir:
+            os.unlink(item_path)
+        else:
+            _fast_rmtree(item_path)
+        return 1
+    except Exception as e:
+        logger.debug("Failed to remove %s: %s", item_path, e)
+        return 0
+
+
 def safely_clear_directory(directory):
     """Safely clear contents of a directory without deleting the directory itself"""
     if not os.path.exists(directory):
@@ -413,18 +451,12 @@ def safely_clear_directory(directory):
     
     count = 0
     try:
-        for item in os.listdir(directory):
-            item_path = os.path.join(directory, item)
-            try:
-                if os.path.isfile(item_path):
-                    os.unlink(item_path)
-                    count += 1
-                elif os.path.isdir(item_path):
-                    import shutil
-                    shutil.rmtree(item_path, ignore_errors=True)
-                    count += 1
-            except Exception as e:
-                logger.debug(f"Failed to remove {item_path}: {str(e)}")
+        with os.scandir(directory) as entries:
+            items = [(entry.path, entry.is_dir(follow_symlinks=False)) for entry in entries]
+        if items:
+            # Entries are independent, so remove them concurrently
+            with ThreadPoolExecutor(max_workers=min(_DELETE_WORKERS, len(items))) as executor:
+                count = sum(executor.map(_remove_entry, items))
     except Exception as e:
         logger.error(f"Error clearing directory {directory}: {str(e)}")
     
@@ -436,31 +468,32 @@ def optimize_windows_cache():
     success = False
     message = ""
     
-    # Clear DNS cache - may work without admin rights on some Windows versions
-    try:
-        run_command("ipconfig /flushdns")
+    # Clear DNS cache (may work without admin rights on some Windows versions),
+    # restart the DNS Client service (usually requires admin rights) and trim
+    # process working sets, all in one shell
+    dns_ok, dns_service_ok, working_sets_ok = run_command_batch([
+        "ipconfig /flushdns",
+        "net stop \"DNS Client\" && net start \"DNS Client\"",
+        "powershell -Command \"Get-Process | ForEach-Object { [void][System.Runtime.InteropServices.Marshal]::SetProcessWorkingSetSize($_.Handle, -1, -1) }\"",
+    ])
+    if dns_ok:
         success = True
         message += "DNS cache cleared. "
-    except Exception as e:
-        logger.error(f"Failed to clear DNS cache: {str(e)}")
+    else:
+        logger.error("Failed to clear DNS cache")
         message += "DNS cache clearing failed. "
     
-    # Try to restart DNS Client service - usually requires admin rights
-    try:
-        run_command("net stop \"DNS Client\" && net start \"DNS Client\"")
+    if dns_service_ok:
         message += "DNS service restarted. "
-    except Exception as e:
-        logger.error(f"Failed to restart DNS service: {str(e)}")
+    else:
+        logger.error("Failed to restart DNS service")
         message += "DNS service restart failed. "
     
-    # Clear system working set
-    try:
-        # This PowerShell command attempts to trim working sets of processes
-        run_command("powershell -Command \"Get-Process | ForEach-Object { [void][System.Runtime.InteropServices.Marshal]::SetProcessWorkingSetSize($_.Handle, -1, -1) }\"")
+    if working_sets_ok:
         success = True
         message += "Process working sets cleared. "
-    except Exception as e:
-        logger.error(f"Failed to clear process working sets: {str(e)}")
+    else:
+        logger.error("Failed to clear process working sets")
         message += "Working set clearing failed. "
     
     # Clear browser caches
@@ -486,9 +519,11 @@ def optimize_linux_cache():
     
     # Balance file system caches - drops clean caches but keeps active ones
     try:
-        run_command("sync && echo 1 > /proc/sys/vm/drop_caches")
-        success = True
-        message += "File system caches balanced. "
+        if run_command_fast("sync && echo 1 > /proc/sys/vm/drop_caches")[0]:
+            success = True
+            message += "File system caches balanced. "
+        else:
+            message += "File system cache balancing failed. "
     except Exception as e:
         logger.error(f"Error optimizing Linux cache: {str(e)}")
         message += "File system cache balancing failed. "
@@ -514,13 +549,11 @@ def optimize_macos_cache():
     message = ""
     
     # Clear DNS cache
-    try:
-        run_command("dscacheutil -flushcache")
-        run_command("killall -HUP mDNSResponder")
+    if all(run_command_batch(["dscacheutil -flushcache", "killall -HUP mDNSResponder"])):
         success = True
         message += "DNS cache cleared. "
-    except Exception as e:
-        logger.error(f"Failed to clear DNS cache: {str(e)}")
+    else:
+        logger.error("Failed to clear DNS cache")
         message += "DNS cache clearing failed. "
     
     # Clear browser caches
@@ -538,170 +571,35 @@ def optimize_macos_cache():
         return False, f"macOS cache optimization failed: {message}"
 
 
-class SimpleOptimizerApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        
-        # Setup UI
-        self.setWindowTitle("Memory & Cache Optimizer")
-        self.setGeometry(100, 100, 600, 400)
-        
-        # Create central widget
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-        
-        # Create main layout
-        main_layout = QVBoxLayout(central_widget)
-        
-        # Create system info section
-        info_layout = QGridLayout()
-        
-        self.total_memory_label = QLabel("Total Memory: --")
-        self.used_memory_label = QLabel("Used Memory: --")
-        self.free_memory_label = QLabel("Free Memory: --")
-        self.memory_percent_label = QLabel("Memory Usage: --")
-        
-        info_layout.addWidget(QLabel("<b>System Information:</b>"), 0, 0, 1, 2)
-        info_layout.addWidget(self.total_memory_label, 1, 0)
-        info_layout.addWidget(self.used_memory_label, 1, 1)
-        info_layout.addWidget(self.free_memory_label, 2, 0)
-        info_layout.addWidget(self.memory_percent_label, 2, 1)
-        
-        main_layout.addLayout(info_layout)
-        
-        # Create memory section
-        memory_group = QGroupBox("Memory Optimization")
-        memory_layout = QVBoxLayout(memory_group)
-        
-        self.memory_progress = QProgressBar()
-        self.memory_progress.setRange(0, 100)
-        
-        memory_button_layout = QHBoxLayout()
-        self.memory_optimize_btn = QPushButton("Optimize Memory")
-        self.memory_optimize_btn.setMinimumHeight(40)
-        self.memory_optimize_btn.clicked.connect(self.optimize_memory)
-        memory_button_layout.addWidget(self.memory_optimize_btn)
-        
-        memory_layout.addWidget(self.memory_progress)
-        memory_layout.addLayout(memory_button_layout)
-        
-        main_layout.addWidget(memory_group)
-        
-        # Create cache section
-        cache_group = QGroupBox("Cache Optimization")
-        cache_layout = QVBoxLayout(cache_group)
-        
-        cache_button_layout = QHBoxLayout()
-        self.cache_optimize_btn = QPushButton("Optimize Cache")
-        self.cache_optimize_btn.setMinimumHeight(40)
-        self.cache_optimize_btn.clicked.connect(self.optimize_cache)
-        cache_button_layout.addWidget(self.cache_optimize_btn)
-        
-        cache_layout.addLayout(cache_button_layout)
-        
-        main_layout.addWidget(cache_group)
-        
-        # Create status section
-        status_layout = QHBoxLayout()
-        self.status_label = QLabel("Ready")
-        status_layout.addWidget(self.status_label)
-        
-        main_layout.addLayout(status_layout)
-        
-        # Add admin warning if necessary
-        if not is_admin():
-            admin_warning = QLabel("⚠️ Running without administrator privileges. Some optimizations will be limited.")
-            admin_warning.setStyleSheet("color: red;")
-            main_layout.addWidget(admin_warning)
-        
-        # Setup timer to update stats
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_stats)
-        self.update_timer.start(1000)  # Update every second
-        
-        # Initial update
-        self.update_stats()
-    
-    def update_stats(self):
-        try:
-            mem = psutil.virtual_memory()
-            
-            total_gb = mem.total / (1024**3)
-            used_gb = mem.used / (1024**3)
-            free_gb = mem.available / (1024**3)
-            
-            self.total_memory_label.setText(f"Total Memory: {total_gb:.2f} GB")
-            self.used_memory_label.setText(f"Used Memory: {used_gb:.2f} GB")
-            self.free_memory_label.setText(f"Free Memory: {free_gb:.2f} GB")
-            self.memory_percent_label.setText(f"Memory Usage: {mem.percent}%")
-            
-            self.memory_progress.setValue(int(mem.percent))
-        except Exception as e:
-            logger.error(f"Error updating stats: {e}")
-    
-    def optimize_memory(self):
-        # Disable the button during optimization
-        self.memory_optimize_btn.setEnabled(False)
-        self.memory_optimize_btn.setText("Optimizing...")
-        self.status_label.setText("Optimizing memory...")
-        
-        # Create and start worker thread
-        self.memory_worker = OptimizeWorker('memory')
-        self.memory_worker.signals.finished.connect(self.on_memory_optimization_finished)
-        self.memory_worker.signals.error.connect(self.on_optimization_error)
-        self.memory_worker.start()
-    
-    def optimize_cache(self):
-        # Disable the button during optimization
-        self.cache_optimize_btn.setEnabled(False)
-        self.cache_optimize_btn.setText("Optimizing...")
-        self.status_label.setText("Optimizing cache...")
-        
-        # Create and start worker thread
-        self.cache_worker = OptimizeWorker('cache')
-        self.cache_worker.signals.finished.connect(self.on_cache_optimization_finished)
-        self.cache_worker.signals.error.connect(self.on_optimization_error)
-        self.cache_worker.start()
-    
-    def on_memory_optimization_finished(self, success, message):
-        # Re-enable the button
-        self.memory_optimize_btn.setEnabled(True)
-        self.memory_optimize_btn.setText("Optimize Memory")
-        
-        if success:
-            self.status_label.setText("Memory optimization completed successfully")
-            QMessageBox.information(self, "Optimization Complete", f"Memory optimization completed successfully.\n\n{message}")
-        else:
-            self.status_label.setText("Memory optimization completed with issues")
-            QMessageBox.warning(self, "Optimization Warning", f"Memory optimization completed with issues.\n\n{message}")
-        
-        # Update stats after optimization
-        self.update_stats()
-    
-    def on_cache_optimization_finished(self, success, message):
-        # Re-enable the button
-        self.cache_optimize_btn.setEnabled(True)
-        self.cache_optimize_btn.setText("Optimize Cache")
-        
-        if success:
-            self.status_label.setText("Cache optimization completed successfully")
-            QMessageBox.information(self, "Optimization Complete", f"Cache optimization completed successfully.\n\n{message}")
-        else:
-            self.status_label.setText("Cache optimization completed with issues")
-            QMessageBox.warning(self, "Optimization Warning", f"Cache optimization completed with issues.\n\n{message}")
-    
-    def on_optimization_error(self, error_message):
-        # Re-enable the buttons
-        self.memory_optimize_btn.setEnabled(True)
-        self.memory_optimize_btn.setText("Optimize Memory")
-        self.cache_optimize_btn.setEnabled(True)
-        self.cache_optimize_btn.setText("Optimize Cache")
-        
-        self.status_label.setText(f"Error: {error_message}")
-        QMessageBox.critical(self, "Optimization Error", f"Error during optimization: {error_message}")
+def _unsupported_system():
+    return False, f"Unsupported operating system: {_SYSTEM}"
 
 
-if __name__ == "__main__":
+# Per-OS optimizers, looked up by optimize_memory/optimize_cache
+_MEM_DISPATCH = {
+    'Windows': optimize_windows_memory,
+    'Linux': optimize_linux_memory,
+    'Darwin': optimize_macos_memory,  # macOS
+}
+_CACHE_DISPATCH = {
+    'Windows': optimize_windows_cache,
+    'Linux': optimize_linux_cache,
+    'Darwin': optimize_macos_cache,  # macOS
+}
+
+
+def _run_gui():
+    """Load the PyQt5 front end and run the application
+
+    Qt is only loaded here so that importing this module for its
+    optimize_* functions does not pay the PyQt5 startup cost.
+    """
+    # Dump a Python traceback if Qt or a native call crashes the process
+    faulthandler.enable()
+
+    from PyQt5.QtWidgets import QApplication
+    from simple_optimizer_gui import SimpleOptimizerApp
+
     try:
         print("Starting simple memory optimizer...")
         # Check for admin privileges
@@ -710,11 +608,17 @@ if __name__ == "__main__":
         
         # Start the application
         app = QApplication(sys.argv)
-        window = SimpleOptimizerApp()
+        window = SimpleOptimizerApp(
+            {'memory': optimize_memory, 'cache': optimize_cache}, admin_status
+        )
         window.show()
         print("Application started successfully")
         sys.exit(app.exec_())
     except Exception as e:
         print(f"Error starting the application: {e}")
         logger.error(f"Error starting the application: {e}")
-        sys.exit(1) 
\ No newline at end of file
+        sys.exit(1) 
+
+
+if __name__ == "__main__":
+    _run_gui()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# simple_optimizer_gui.py - PyQt5 front end for simple_optimizer
+#
+# The optimizer functions are passed in by simple_optimizer._run_gui rather
+# than imported, so running simple_optimizer.py as a script does not load
+# that module a second time under its own name
+
+import logging
+from PyQt5.QtWidgets import (
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
+    QProgressBar, QGridLayout, QMessageBox, QGroupBox
+)
+from PyQt5.QtCore import QTimer, pyqtSignal, QObject, QRunnable, QThreadPool
+import psutil
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerSignals(QObject):
+    '''Defines the signals available from a running worker thread.'''
+    finished = pyqtSignal(bool, str)
+    error = pyqtSignal(str)
+
+
+class OptimizeWorker(QRunnable):
+    '''Pooled task for running optimization tasks'''
+    def __init__(self, optimize_type, optimize):
+        super().__init__()
+        self.optimize_type = optimize_type
+        self.optimize = optimize
+        self.signals = WorkerSignals()
+        self.setAutoDelete(True)
+        
+    def run(self):
+        try:
+            success, message = self.optimize()
+                
+            # Emit results
+            self.signals.finished.emit(success, message)
+        except Exception as e:
+            logger.error(f"Error in {self.optimize_type} optimization worker: {e}")
+            self.signals.error.emit(str(e))
+
+
+class SimpleOptimizerApp(QMainWindow):
+    def __init__(self, optimizers, admin):
+        super().__init__()
+        # Optimizer callables keyed by 'memory' and 'cache', each returning
+        # (success, message), and whether the process has admin rights
+        self.optimizers = optimizers
+        
+        # Setup UI
+        self.setWindowTitle("Memory & Cache Optimizer")
+        self.setGeometry(100, 100, 600, 400)
+        
+        # Create central widget
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        
+        # Create main layout
+        main_layout = QVBoxLayout(central_widget)
+        
+        # Create system info section
+        info_layout = QGridLayout()
+        
+        self.total_memory_label = QLabel("Total Memory: --")
+        self.used_memory_label = QLabel("Used Memory: --")
+        self.free_memory_label = QLabel("Free Memory: --")
+        self.memory_percent_label = QLabel("Memory Usage: --")
+        
+        info_layout.addWidget(QLabel("<b>System Information:</b>"), 0, 0, 1, 2)
+        info_layout.addWidget(self.total_memory_label, 1, 0)
+        info_layout.addWidget(self.used_memory_label, 1, 1)
+        info_layout.addWidget(self.free_memory_label, 2, 0)
+        info_layout.addWidget(self.memory_percent_label, 2, 1)
+        
+        main_layout.addLayout(info_layout)
+        
+        # Create memory section
+        memory_group = QGroupBox("Memory Optimization")
+        memory_layout = QVBoxLayout(memory_group)
+        
+        self.memory_progress = QProgressBar()
+        self.memory_progress.setRange(0, 100)
+        
+        memory_button_layout = QHBoxLayout()
+        self.memory_optimize_btn = QPushButton("Optimize Memory")
+        self.memory_optimize_btn.setMinimumHeight(40)
+        self.memory_optimize_btn.clicked.connect(self.optimize_memory)
+        memory_button_layout.addWidget(self.memory_optimize_btn)
+        
+        memory_layout.addWidget(self.memory_progress)
+        memory_layout.addLayout(memory_button_layout)
+        
+        main_layout.addWidget(memory_group)
+        
+        # Create cache section
+        cache_group = QGroupBox("Cache Optimization")
+        cache_layout = QVBoxLayout(cache_group)
+        
+        cache_button_layout = QHBoxLayout()
+        self.cache_optimize_btn = QPushButton("Optimize Cache")
+        self.cache_optimize_btn.setMinimumHeight(40)
+        self.cache_optimize_btn.clicked.connect(self.optimize_cache)
+        cache_button_layout.addWidget(self.cache_optimize_btn)
+        
+        cache_layout.addLayout(cache_button_layout)
+        
+        main_layout.addWidget(cache_group)
+        
+        # Create status section
+        status_layout = QHBoxLayout()
+        self.status_label = QLabel("Ready")
+        status_layout.addWidget(self.status_label)
+        
+        main_layout.addLayout(status_layout)
+        
+        # Add admin warning if necessary
+        if not admin:
+            admin_warning = QLabel("⚠️ Running without administrator privileges. Some optimizations will be limited.")
+            admin_warning.setStyleSheet("color: red;")
+            main_layout.addWidget(admin_warning)
+        
+        # Setup timer to update stats
+        self.update_timer = QTimer()
+        self.update_timer.timeout.connect(self.update_stats)
+        self.update_timer.start(2000)  # Update every 2 seconds
+        
+        # Last rendered label values, so unchanged ticks skip the repaint
+        self._last = {}
+        self._last_pct = -1
+        
+        # Initial update
+        self.update_stats()
+    
+    def update_stats(self):
+        try:
+            mem = psutil.virtual_memory()
+            
+            total_gb = mem.total / (1024**3)
+            used_gb = mem.used / (1024**3)
+            free_gb = mem.available / (1024**3)
+            
+            # Each label changes on its own, so compare the rendered text per label
+            for key, label, text in (
+                ('total', self.total_memory_label, f"Total Memory: {total_gb:.2f} GB"),
+                ('used', self.used_memory_label, f"Used Memory: {used_gb:.2f} GB"),
+                ('free', self.free_memory_label, f"Free Memory: {free_gb:.2f} GB"),
+                ('pct', self.memory_percent_label, f"Memory Usage: {mem.percent}%"),
+            ):
+                if text != self._last.get(key):
+                    label.setText(text)
+                    self._last[key] = text
+            
+            # The bar only moves in whole percents, so repaint it only then
+            pct = int(mem.percent)
+            if pct != self._last_pct:
+                self.memory_progress.setValue(pct)
+                self._last_pct = pct
+        except Exception as e:
+            logger.error(f"Error updating stats: {e}")
+    
+    def optimize_memory(self):
+        # Disable the button during optimization
+        self.memory_optimize_btn.setEnabled(False)
+        self.memory_optimize_btn.setText("Optimizing...")
+        self.status_label.setText("Optimizing memory...")
+        
+        # Run the worker on Qt's shared thread pool
+        self.memory_worker = OptimizeWorker('memory', self.optimizers['memory'])
+        self.memory_worker.signals.finished.connect(self.on_memory_optimization_finished)
+        self.memory_worker.signals.error.connect(self.on_optimization_error)
+        QThreadPool.globalInstance().start(self.memory_worker)
+    
+    def optimize_cache(self):
+        # Disable the button during optimization
+        self.cache_optimize_btn.setEnabled(False)
+        self.cache_optimize_btn.setText("Optimizing...")
+        self.status_label.setText("Optimizing cache...")
+        
+        # Run the worker on Qt's shared thread pool
+        self.cache_worker = OptimizeWorker('cache', self.optimizers['cache'])
+        self.cache_worker.signals.finished.connect(self.on_cache_optimization_finished)
+        self.cache_worker.signals.error.connect(self.on_optimization_error)
+        QThreadPool.globalInstance().start(self.cache_worker)
+    
+    def on_memory_optimization_finished(self, success, message):
+        # Re-enable the button
+        self.memory_optimize_btn.setEnabled(True)
+        self.memory_optimize_btn.setText("Optimize Memory")
+        
+        if success:
+            self.status_label.setText("Memory optimization completed successfully")
+            QMessageBox.information(self, "Optimization Complete", f"Memory optimization completed successfully.\n\n{message}")
+        else:
+            self.status_label.setText("Memory optimization completed with issues")
+            QMessageBox.warning(self, "Optimization Warning", f"Memory optimization completed with issues.\n\n{message}")
+        
+        # Update stats after optimization
+        self.update_stats()
+    
+    def on_cache_optimization_finished(self, success, message):
+        # Re-enable the button
+        self.cache_optimize_btn.setEnabled(True)
+        self.cache_optimize_btn.setText("Optimize Cache")
+        
+        if success:
+            self.status_label.setText("Cache optimization completed successfully")
+            QMessageBox.information(self, "Optimization Complete", f"Cache optimization completed successfully.\n\n{message}")
+        else:
+            self.status_label.setText("Cache optimization completed with issues")
+            QMessageBox.warning(self, "Optimization Warning", f"Cache optimization completed with issues.\n\n{message}")
+    
+    def on_optimization_error(self, error_message):
+        # Re-enable the buttons
+        self.memory_optimize_btn.setEnabled(True)
+        self.memory_optimize_btn.setText("Optimize Memory")
+        self.cache_optimize_btn.setEnabled(True)
+        self.cache_optimize_btn.setText("Optimize Cache")
+        
+        self.status_label.setText(f"Error: {error_message}")
+        QMessageBox.critical(self, "Optimization Error", f"Error during optimization: {error_message}")
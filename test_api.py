@@ -1,16 +1,17 @@
+import time
 import unittest
-import json
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from unittest import mock
 
+from app.camparison import _OPTIMIZATION_JOBS
 from app.comparison import app
 
 class TestAPI(unittest.TestCase):
-    def setUp(self):
-        self.app = app.test_client()
-        self.app_context = app.app_context()
-        self.app_context.push()
+    @classmethod
+    def setUpClass(cls):
+        # One client serves every test in the class; under pytest the app
+        # context comes from the session fixture in conftest.py, and the
+        # test client makes its own request context either way
+        cls.app = app.test_client()
 
     def test_index_route(self):
         """Test if the index route returns the template"""
@@ -23,7 +24,7 @@ class TestAPI(unittest.TestCase):
         response = self.app.get('/api/real-time-stats')
         self.assertEqual(response.status_code, 200)
         
-        data = json.loads(response.data)
+        data = response.get_json()
         # Check if response contains required sections
         self.assertIn('memory', data)
         self.assertIn('cache', data)
@@ -34,7 +35,7 @@ class TestAPI(unittest.TestCase):
         response = self.app.get('/api/optimize-memory')
         self.assertEqual(response.status_code, 200)
         
-        data = json.loads(response.data)
+        data = response.get_json()
         # Check if response contains before/after stats
         self.assertIn('before', data)
         self.assertIn('after', data)
@@ -48,7 +49,7 @@ class TestAPI(unittest.TestCase):
         response = self.app.get('/api/optimize-cache')
         self.assertEqual(response.status_code, 200)
         
-        data = json.loads(response.data)
+        data = response.get_json()
         # Check if response contains before/after stats
         self.assertIn('before', data)
         self.assertIn('after', data)
@@ -62,7 +63,7 @@ class TestAPI(unittest.TestCase):
         response = self.app.get('/api/visualization')
         self.assertEqual(response.status_code, 200)
         
-        data = json.loads(response.data)
+        data = response.get_json()
         # Check if response contains Plotly figure data
         self.assertIn('data', data)
         self.assertIn('layout', data)
@@ -71,13 +72,48 @@ class TestAPI(unittest.TestCase):
         self.assertGreaterEqual(len(data['data']), 4)  # At least 4 charts
         self.assertIn('subplot_titles', data['layout'])
 
+    def test_queue_optimization(self):
+        """Test if optimizations can be queued and their status polled"""
+        # A stub job keeps the background worker from clearing real temp files
+        stub_result = {'success': True, 'message': 'stubbed'}
+        with mock.patch.dict(_OPTIMIZATION_JOBS, {'memory': lambda: (stub_result, 200)}):
+            response = self.app.post('/api/optimize/memory')
+            self.assertEqual(response.status_code, 202)
+            
+            data = response.get_json()
+            self.assertIn('task_id', data)
+            self.assertEqual(data['status'], 'queued')
+            
+            # The task is tracked until it finishes in the background
+            for _ in range(50):
+                response = self.app.get(f"/api/optimize/status/{data['task_id']}")
+                self.assertEqual(response.status_code, 200)
+                task = response.get_json()
+                if task['status'] == 'done':
+                    break
+                time.sleep(0.1)
+        
+        self.assertEqual(task['kind'], 'memory')
+        self.assertEqual(task['status'], 'done')
+        self.assertEqual(task['result'], stub_result)
+
+    def test_queue_unknown_optimization(self):
+        """Test if unknown optimization kinds and task ids are rejected"""
+        response = self.app.post('/api/optimize/unknown')
+        self.assertEqual(response.status_code, 404)
+        self.assertIn('error', response.get_json())
+        
+        response = self.app.get('/api/optimize/status/missing-task')
+        self.assertEqual(response.status_code, 404)
+        self.assertIn('error', response.get_json())
+
     def test_error_handling(self):
         """Test if error handling works properly"""
         # Test 404 error
         response = self.app.get('/nonexistent-route')
         self.assertEqual(response.status_code, 404)
         
-        data = json.loads(response.data)
+        data = response.get_json()
         self.assertIn('error', data)
 
 if __name__ == '__main__':
@@ -1,16 +1,15 @@
 import unittest
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.comparison import MemoryMonitor, app
+from app.comparison import MemoryMonitor
 
 class TestMemoryMonitor(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.monitor = MemoryMonitor()
+
     def setUp(self):
-        self.monitor = MemoryMonitor()
-        self.app = app.test_client()
-        self.app_context = app.app_context()
-        self.app_context.push()
+        # Emptying the shared monitor keeps history lengths independent between tests
+        self.monitor.clear_history()
 
     def test_memory_stats(self):
         """Test if memory statistics are properly retrieved"""
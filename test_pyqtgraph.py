@@ -1,26 +1,63 @@
-import sys
-from PyQt5.QtWidgets import QApplication, QMainWindow
-import pyqtgraph as pg
+import os
+import unittest
 
-# Create the application
-app = QApplication(sys.argv)
+from app._qt_fixture import HAS_QT, get_qapp
 
-# Create a window
-win = QMainWindow()
-win.setWindowTitle('PyQtGraph Test')
-win.resize(800, 600)
 
-# Create a plot widget
-plot_widget = pg.PlotWidget()
-win.setCentralWidget(plot_widget)
+# Global pyqtgraph options this test changes and must put back
+_PG_OPTIONS = ('useOpenGL', 'antialias', 'enableExperimental')
 
-# Add data to the plot
-x = list(range(10))
-y = [i**2 for i in x]
-plot_widget.plot(x, y, pen='r')
 
-# Show the window
-win.show()
+@unittest.skipUnless(HAS_QT, 'Qt cannot start on this platform')
+class TestPyQtGraph(unittest.TestCase):
+    def setUp(self):
+        import pyqtgraph as pg
 
-# Start the event loop
-sys.exit(app.exec_()) 
\ No newline at end of file
+        # setConfigOptions is process-wide, so restore the old values afterwards
+        self._saved_options = {name: pg.getConfigOption(name) for name in _PG_OPTIONS}
+
+        # Draw curves through OpenGL rather than QPainter, except on the offscreen
+        # platform, which usually has no GL context; VMEM_OPENGL=1 or 0 overrides
+        default = '0' if os.environ.get('QT_QPA_PLATFORM') == 'offscreen' else '1'
+        use_opengl = os.environ.get('VMEM_OPENGL', default) == '1'
+        pg.setConfigOptions(useOpenGL=use_opengl, antialias=False, enableExperimental=use_opengl)
+
+    def tearDown(self):
+        import pyqtgraph as pg
+        pg.setConfigOptions(**self._saved_options)
+
+    def test_plot_renders(self):
+        """Test if a pyqtgraph plot can be created and shown"""
+        from PyQt5.QtWidgets import QMainWindow
+        import numpy as np
+        import pyqtgraph as pg
+
+        qapp = get_qapp()
+
+        # Create a window
+        win = QMainWindow()
+        win.setWindowTitle('PyQtGraph Test')
+        win.resize(800, 600)
+
+        # Create a plot widget
+        plot_widget = pg.PlotWidget()
+        win.setCentralWidget(plot_widget)
+
+        # Only draw what is visible, decimated to the pixel width, for large payloads
+        plot_widget.setDownsampling(auto=True, mode='peak')
+        plot_widget.setClipToView(True)
+
+        # Add data to the plot; numpy arrays reach Qt without per-element conversion
+        x = np.arange(10, dtype=np.float64)
+        y = x * x
+        plot_widget.plot(x, y, pen='r')
+
+        win.show()
+
+        # Process one round of events instead of blocking in exec_()
+        qapp.processEvents()
+        self.assertTrue(win.isVisible())
+        win.close()
+
+if __name__ == '__main__':
+    unittest.main()
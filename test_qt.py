@@ -1,11 +1,27 @@
-import sys
-from PyQt5.QtWidgets import QApplication, QLabel, QMainWindow
-
-app = QApplication(sys.argv)
-window = QMainWindow()
-window.setWindowTitle("PyQt5 Test")
-window.setGeometry(100, 100, 280, 80)
-label = QLabel("PyQt5 is working!", window)
-label.move(90, 30)
-window.show()
-sys.exit(app.exec_()) 
\ No newline at end of file
+import unittest
+
+from app._qt_fixture import HAS_QT, get_qapp
+
+
+@unittest.skipUnless(HAS_QT, 'Qt cannot start on this platform')
+class TestQt(unittest.TestCase):
+    def test_window_shows(self):
+        """Test if a basic PyQt5 window can be created and shown"""
+        from PyQt5.QtWidgets import QLabel, QMainWindow
+
+        qapp = get_qapp()
+
+        window = QMainWindow()
+        window.setWindowTitle("PyQt5 Test")
+        window.setGeometry(100, 100, 280, 80)
+        label = QLabel("PyQt5 is working!", window)
+        label.move(90, 30)
+        window.show()
+
+        # Process one round of events instead of blocking in exec_()
+        qapp.processEvents()
+        self.assertTrue(window.isVisible())
+        window.close()
+
+if __name__ == '__main__':
+    unittest.main()